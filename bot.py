@@ -8,10 +8,13 @@ import os
 import re
 import json
 import time
+import queue
 import random
+import atexit
 import logging
 import threading
 from datetime import datetime, timedelta
+from logging.handlers import QueueHandler, QueueListener
 from dotenv import load_dotenv
 from slack_bolt import App
 from slack_bolt.adapter.socket_mode import SocketModeHandler
@@ -30,11 +33,17 @@ import sheet_monitor
 # Load environment variables
 load_dotenv()
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
+# Configure logging. Handlers only enqueue records; a background listener
+# does the actual writes, so a slow terminal or journald never stalls a
+# Slack handler or an SMTP send.
+_log_queue = queue.SimpleQueue()
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s"))
+logging.getLogger().addHandler(QueueHandler(_log_queue))
+logging.getLogger().setLevel(logging.INFO)
+_log_listener = QueueListener(_log_queue, _log_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logger = logging.getLogger(__name__)
 
 # Initialize the Slack app
@@ -581,19 +590,24 @@ def _handle_onboard_send_email(email: str, channel_id: str, user_id: str, client
         first_name = ""
         last_name = ""
 
-    ok = mailer.send_welcome_email(email.lower(), first_name, last_name, invite_link)
-    if ok:
-        if member:
-            db.mark_email_sent(email.lower())
-        client.chat_postEphemeral(
-            channel=channel_id, user=user_id,
-            text=f":white_check_mark: Welcome email sent to `{email}`."
-        )
-    else:
-        client.chat_postEphemeral(
-            channel=channel_id, user=user_id,
-            text=f":x: Failed to send email to `{email}`. Check bot logs for details."
-        )
+    def _on_sent(ok: bool):
+        if ok:
+            if member:
+                db.mark_email_sent(email.lower())
+            client.chat_postEphemeral(
+                channel=channel_id, user=user_id,
+                text=f":white_check_mark: Welcome email sent to `{email}`."
+            )
+        else:
+            client.chat_postEphemeral(
+                channel=channel_id, user=user_id,
+                text=f":x: Failed to send email to `{email}`. Check bot logs for details."
+            )
+
+    # Sent by the mailer's background worker so the command handler returns immediately
+    if not mailer.queue_welcome_email(email.lower(), first_name, last_name, invite_link,
+                                      on_done=_on_sent):
+        _on_sent(False)
 
 
 # ============================================================================
@@ -1438,34 +1452,20 @@ def _handle_outreach_send(args: str, channel_id: str, user_id: str, client):
             club_name = c.get("club_name", "").strip()
             greeting_by_email[email_key] = f"Sevgili {club_name}," if club_name else "Sevgili Yetkili,"
 
-    # Send directly in a background thread
-    def _send_manual():
-        sent = 0
-        failed = 0
-        for email in emails:
-            if campaign["audience_type"] == "academics":
-                greeting = greeting_by_email.get(email, "Sayın Hocam,")
-            else:
-                greeting = greeting_by_email.get(email, "Sevgili Yetkili,")
-
-            ok = mailer.send_outreach_email(
-                to_email=email,
-                subject=campaign["subject"],
-                greeting=greeting,
-                body=campaign["body"]
-            )
-            if ok:
-                sent += 1
-            else:
-                failed += 1
-
-            if len(emails) > 1:
-                time.sleep(2.5)
+    # Queue the sends on the mailer's background worker; the last callback posts the summary
+    counts = {"sent": 0, "failed": 0}
+    counts_lock = threading.Lock()
 
+    def _on_sent(ok: bool):
+        with counts_lock:
+            counts["sent" if ok else "failed"] += 1
+            done = counts["sent"] + counts["failed"] == len(emails)
+        if not done:
+            return
         try:
             client.chat_postMessage(
                 channel=channel_id,
-                text=f":white_check_mark: Manual send for campaign #{campaign_id}: {sent} sent, {failed} failed out of {len(emails)}."
+                text=f":white_check_mark: Manual send for campaign #{campaign_id}: {counts['sent']} sent, {counts['failed']} failed out of {len(emails)}."
             )
         except Exception:
             pass
@@ -1475,12 +1475,27 @@ def _handle_outreach_send(args: str, channel_id: str, user_id: str, client):
         text=f":email: Sending campaign #{campaign_id} to {len(emails)} address(es)..."
     )
 
-    thread = threading.Thread(target=_send_manual, daemon=True)
-    thread.start()
+    for email in emails:
+        if campaign["audience_type"] == "academics":
+            greeting = greeting_by_email.get(email, "Sayın Hocam,")
+        else:
+            greeting = greeting_by_email.get(email, "Sevgili Yetkili,")
+
+        queued = mailer.queue_outreach_email(
+            to_email=email,
+            subject=campaign["subject"],
+            greeting=greeting,
+            body=campaign["body"],
+            on_done=_on_sent,
+        )
+        if not queued:
+            _on_sent(False)
 
 
 def _run_outreach_campaign(campaign_id: int, channel_id: str, client):
     """Background function to send outreach emails with rate limiting."""
+    # One SMTP login for the whole campaign instead of one per recipient
+    session = mailer.MailSession()
     try:
         campaign = db.get_outreach_campaign(campaign_id)
         if not campaign:
@@ -1502,7 +1517,8 @@ def _run_outreach_campaign(campaign_id: int, channel_id: str, client):
                 to_email=recipient["email"],
                 subject=campaign["subject"],
                 greeting=recipient["greeting"],
-                body=campaign["body"]
+                body=campaign["body"],
+                session=session
             )
 
             if success:
@@ -1551,6 +1567,9 @@ def _run_outreach_campaign(campaign_id: int, channel_id: str, client):
         except Exception:
             pass
 
+    finally:
+        session.close()
+
 
 # ============================================================================
 # TEAM JOIN HANDLER (Onboarding)
@@ -1849,11 +1868,13 @@ def check_new_registrations() -> int:
     """Check Google Sheet for new registrations and send welcome emails."""
     count = 0
     try:
-        registrations = sheets.fetch_registrations()
         invite_link = SLACK_INVITE_LINK
         cutoff = ONBOARD_AFTER_DATE
+        welcome = WELCOME_METHOD
+        send_welcome = welcome in ("email", "both") and invite_link
+        new_members = []
 
-        for reg in registrations:
+        for reg in sheets.iter_registrations():
             email = reg.get("email", "").lower()
             if not email:
                 continue
@@ -1877,42 +1898,37 @@ def check_new_registrations() -> int:
                 continue
 
             count += 1
-
-            # Send welcome email if configured
-            welcome = WELCOME_METHOD
-            if welcome in ("email", "both") and invite_link:
-                success = mailer.send_welcome_email(
-                    to_email=email,
-                    first_name=reg.get("first_name", ""),
-                    last_name=reg.get("last_name", ""),
-                    invite_link=invite_link
-                )
-                if success:
-                    db.mark_email_sent(email)
-                    if GOOGLE_GROUP_EMAIL:
-                        if google_groups.add_member_to_group(email):
-                            db.mark_group_added(email)
+            new_members.append((email, reg.get("first_name", ""), reg.get("last_name", ""), invite_link))
+
+        # Send welcome emails if configured, concurrently via the mail workers
+        if send_welcome and new_members:
+            results = mailer.send_welcome_batch(new_members)
+            sent_emails = [email for email, ok in results.items() if ok]
+            for email in sent_emails:
+                db.mark_email_sent(email)
+            if GOOGLE_GROUP_EMAIL and sent_emails:
+                for email, ok in google_groups.add_members_to_group(sent_emails).items():
+                    if ok:
+                        db.mark_group_added(email)
 
         # Retry failed emails
-        pending = db.get_pending_email_members()
-        welcome = WELCOME_METHOD
-        if welcome in ("email", "both") and invite_link:
-            for member in pending:
-                if member.get("email_sent") == 0 and count == 0:
-                    success = mailer.send_welcome_email(
-                        to_email=member["email"],
-                        first_name=member.get("first_name", ""),
-                        last_name=member.get("last_name", ""),
-                        invite_link=invite_link
-                    )
-                    if success:
-                        db.mark_email_sent(member["email"])
+        if send_welcome and count == 0:
+            retries = [
+                (m["email"], m.get("first_name", ""), m.get("last_name", ""), invite_link)
+                for m in db.get_pending_email_members()
+                if m.get("email_sent") == 0
+            ]
+            for email, ok in mailer.send_welcome_batch(retries).items():
+                if ok:
+                    db.mark_email_sent(email)
 
         # Retry Google Group adds for members whose email was sent but group add failed/skipped
         if GOOGLE_GROUP_EMAIL:
-            for member in db.get_pending_group_members():
-                if google_groups.add_member_to_group(member["email"]):
-                    db.mark_group_added(member["email"])
+            pending_emails = [m["email"] for m in db.get_pending_group_members()]
+            added = google_groups.add_members_to_group(pending_emails)
+            for email, ok in added.items():
+                if ok:
+                    db.mark_group_added(email)
 
     except Exception as e:
         logger.error(f"Error checking new registrations: {e}")
@@ -1924,8 +1940,7 @@ def _seed_existing_members() -> int:
     """Import all current sheet entries as already onboarded (no emails sent)."""
     count = 0
     try:
-        registrations = sheets.fetch_registrations()
-        for reg in registrations:
+        for reg in sheets.iter_registrations():
             email = reg.get("email", "").lower()
             if not email:
                 continue
@@ -2078,14 +2093,19 @@ def _schedule_random_posts():
 
 def _add_jobs_to_queue(jobs: list) -> int:
     """Deduplicate and enqueue a list of Job objects. Returns count added."""
+    opps = [j.to_opportunity_dict() for j in jobs]
+    return _add_opportunities_to_queue(opps)
+
+
+def _add_opportunities_to_queue(opps: list[dict]) -> int:
+    """Enqueue opportunity dicts not yet posted or pending (one DB lookup). Returns count added."""
+    opps = [o for o in opps if o.get("guid")]
+    known = db.get_known_opportunity_guids(o["guid"] for o in opps)
     added = 0
-    for j in jobs:
-        opp = j.to_opportunity_dict()
-        guid = opp.get("guid", "")
-        if not guid:
-            continue
-        if db.is_opportunity_posted(guid) or db.is_opportunity_pending(guid):
+    for opp in opps:
+        if opp["guid"] in known:
             continue
+        known.add(opp["guid"])
         db.add_pending_opportunity(opp)
         added += 1
     return added
@@ -2150,15 +2170,7 @@ def refresh_rss_queue():
     try:
         # RSS feeds (jobrxiv, opportunitydesk)
         opportunities = rss_feed.fetch_bioinformatics_opportunities()
-        rss_added = 0
-        for opp in opportunities:
-            guid = opp.get("guid", "")
-            if not guid:
-                continue
-            if db.is_opportunity_posted(guid) or db.is_opportunity_pending(guid):
-                continue
-            db.add_pending_opportunity(opp)
-            rss_added += 1
+        rss_added = _add_opportunities_to_queue(opportunities)
         logger.info(f"RSS queue refreshed: {rss_added} new items added")
 
         # Workday (free, no key needed)
@@ -2683,6 +2695,9 @@ def main():
     db.init_db()
     logger.info("Database initialized")
 
+    # Close pooled SMTP connections cleanly on shutdown
+    atexit.register(mailer.shutdown_smtp_pool)
+
     # Start scheduler for background jobs
     scheduler.add_job(check_expired_polls, "interval", minutes=1)
     scheduler.add_job(check_new_registrations, "interval", hours=1)
@@ -8,7 +8,7 @@ import os
 import shutil
 import logging
 from datetime import datetime
-from typing import Optional
+from typing import Iterable, Optional
 from contextlib import contextmanager
 
 logger = logging.getLogger(__name__)
@@ -1373,6 +1373,25 @@ def remove_pending_opportunity(guid: str):
         cursor.execute("DELETE FROM pending_opportunities WHERE guid = ?", (guid,))
 
 
+def get_known_opportunity_guids(guids: Iterable[str]) -> set[str]:
+    """Return the subset of guids already posted or waiting in the pending queue."""
+    guids = list(guids)
+    known = set()
+    with get_db() as conn:
+        cursor = conn.cursor()
+        # Each chunk binds its guids twice; stay under SQLite's 999-variable limit
+        for i in range(0, len(guids), 400):
+            chunk = guids[i:i + 400]
+            marks = ",".join("?" * len(chunk))
+            cursor.execute(f"""
+                SELECT guid FROM posted_opportunities WHERE guid IN ({marks})
+                UNION
+                SELECT guid FROM pending_opportunities WHERE guid IN ({marks})
+            """, chunk + chunk)
+            known.update(row["guid"] for row in cursor.fetchall())
+    return known
+
+
 # ============================================================================
 # RSVP TOGGLE (Phase 2)
 # ============================================================================
@@ -9,10 +9,35 @@ Setup:
 2. Set env vars:
    GOOGLE_GROUP_EMAIL  — e.g. members@nyrsg.org
    GOOGLE_ADMIN_EMAIL  — a workspace admin email to impersonate
+   GOOGLEAPI_CACHE_DIR — optional, cache directory for HTTP responses and access
+                         tokens (default .cache/googleapi)
 """
 
 import os
+import json
+import fcntl
+import hashlib
 import logging
+import time
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Any
+
+# Optional imports; an empty tuple never matches in isinstance()
+try:
+    from google.auth.exceptions import RefreshError
+    from google.oauth2 import service_account
+except ImportError:  # google-auth not installed; Group adds will log an error
+    RefreshError = ()
+    service_account = None
+
+try:
+    from googleapiclient.errors import HttpError
+except ImportError:  # google-api-python-client not installed
+    HttpError = ()
 
 logger = logging.getLogger(__name__)
 
@@ -20,16 +45,197 @@ GOOGLE_SERVICE_ACCOUNT_PATH = os.getenv("GOOGLE_SERVICE_ACCOUNT_PATH", "./servic
 GOOGLE_GROUP_EMAIL = os.getenv("GOOGLE_GROUP_EMAIL", "")
 GOOGLE_ADMIN_EMAIL = os.getenv("GOOGLE_ADMIN_EMAIL", "")
 
+HTTP_TIMEOUT = 10  # seconds
+
 ADMIN_SCOPE = "https://www.googleapis.com/auth/admin.directory.group.member"
 
+# Delegated credentials and built Directory API clients, keyed by the impersonated admin email
+_credentials_cache: dict[str, Any] = {}
+_service_cache: dict[str, Any] = {}
+_service_lock = threading.Lock()
 
-def add_member_to_group(email: str) -> bool:
+# httplib2.Http is not thread-safe, so each thread keeps its own authorized connection
+_thread_local = threading.local()
+
+# A cached access token is reused only if it stays valid at least this long
+TOKEN_EXPIRY_MARGIN = timedelta(minutes=5)
+
+
+@lru_cache(maxsize=1)
+def _cache_dir() -> str:
     """
-    Add a member to the configured Google Group via Admin SDK with DWD.
+    GOOGLEAPI_CACHE_DIR, read on first use. Not read at import: bot.py imports
+    this module before load_dotenv() runs.
+    """
+    return os.getenv("GOOGLEAPI_CACHE_DIR") or ".cache/googleapi"
 
-    Returns True on success or if member already exists (idempotent).
-    Returns False on failure (logs descriptive error).
+
+if service_account is not None:
+    class _DiskCachedCredentials(service_account.Credentials):
+        """
+        Service account credentials that share their access token across process
+        restarts through a small JSON file in GOOGLEAPI_CACHE_DIR, so a fresh
+        process skips the JWT → token exchange while the last token is still valid.
+        """
+
+        def _token_cache_path(self) -> str:
+            key = "|".join([
+                self.service_account_email,
+                self._subject or "",
+                " ".join(sorted(self._scopes or [])),
+            ])
+            digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:32]
+            return os.path.join(_cache_dir(), f"gtoken-{digest}.json")
+
+        def _load_cached_token(self, path: str, rejected: str = None) -> bool:
+            try:
+                with open(path) as f:
+                    data = json.load(f)
+                expiry = datetime.fromisoformat(data["expiry"])
+                if data["token"] == rejected:
+                    return False
+            except (OSError, ValueError, KeyError):
+                return False
+            # google-auth keeps expiry as a naive UTC datetime
+            now = datetime.now(timezone.utc).replace(tzinfo=None)
+            if expiry - TOKEN_EXPIRY_MARGIN <= now:
+                return False
+            self.token = data["token"]
+            self.expiry = expiry
+            return True
+
+        def _save_token(self, path: str):
+            try:
+                fd, tmp_path = tempfile.mkstemp(dir=_cache_dir(), prefix=".gtoken-")
+                with os.fdopen(fd, "w") as f:
+                    json.dump({"token": self.token, "expiry": self.expiry.isoformat()}, f)
+                os.replace(tmp_path, path)
+            except OSError as e:
+                logger.warning(f"Could not cache Google access token: {e}")
+
+        def refresh(self, request):
+            try:
+                os.makedirs(_cache_dir(), exist_ok=True)
+                path = self._token_cache_path()
+                lock_file = open(path + ".lock", "w")
+            except OSError as e:
+                logger.warning(f"Google token cache unavailable: {e}")
+                super().refresh(request)
+                return
+
+            # Lock so concurrent workers/processes exchange the JWT only once
+            with lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                # AuthorizedHttp also refreshes after a 401, so the token we hold may
+                # have been rejected; never load that same token back from disk
+                if self._load_cached_token(path, rejected=self.token):
+                    return
+                super().refresh(request)
+                self._save_token(path)
+
+
+def _get_credentials(admin_email: str):
+    """Load the service account once and return credentials delegated to admin_email."""
+    credentials = _credentials_cache.get(admin_email)
+    if credentials is not None:
+        return credentials
+
+    with _service_lock:
+        credentials = _credentials_cache.get(admin_email)
+        if credentials is None:
+            if service_account is None:
+                raise ImportError("google-auth is not installed")
+
+            credentials = _DiskCachedCredentials.from_service_account_file(
+                GOOGLE_SERVICE_ACCOUNT_PATH,
+                scopes=[ADMIN_SCOPE],
+            ).with_subject(admin_email)
+            _credentials_cache[admin_email] = credentials
+    return credentials
+
+
+def _authorized_http(admin_email: str):
+    """
+    Return this thread's AuthorizedHttp for admin_email.
+
+    The underlying httplib2.Http keeps the TLS connection to Google alive between
+    calls and caches cacheable GETs under GOOGLEAPI_CACHE_DIR. google-auth refreshes
+    the delegated access token on its own when it nears expiry.
+    """
+    https = getattr(_thread_local, "https", None)
+    if https is None:
+        https = _thread_local.https = {}
+
+    http = https.get(admin_email)
+    if http is None:
+        import httplib2
+        import google_auth_httplib2
+
+        http = google_auth_httplib2.AuthorizedHttp(
+            _get_credentials(admin_email),
+            http=httplib2.Http(cache=_cache_dir(), timeout=HTTP_TIMEOUT),
+        )
+        https[admin_email] = http
+    return http
+
+
+def _get_service(admin_email: str):
     """
+    Return a Directory API client impersonating admin_email, built once per process.
+
+    The client is shared between threads; pass http=_authorized_http(...) to
+    execute() so each thread uses its own connection.
+    """
+    service = _service_cache.get(admin_email)
+    if service is not None:
+        return service
+
+    http = _authorized_http(admin_email)
+    with _service_lock:
+        service = _service_cache.get(admin_email)
+        if service is None:
+            from googleapiclient.discovery import build
+
+            # static_discovery uses the discovery document bundled with the library
+            service = build(
+                "admin", "directory_v1",
+                http=http,
+                cache_discovery=False,
+                static_discovery=True,
+            )
+            _service_cache[admin_email] = service
+    return service
+
+
+# Admin SDK accepts at most 1000 sub-requests per batch call
+BATCH_LIMIT = 1000
+
+# Directory API quota is 2400 requests/minute; parallel adds stay under it
+MAX_REQUESTS_PER_SECOND = 40
+
+
+class _RateLimiter:
+    """Thread-safe pacer spacing calls at least 1/rate seconds apart."""
+
+    def __init__(self, rate: float):
+        self._interval = 1 / rate
+        self._next_at = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next_at - now
+            self._next_at = max(now, self._next_at) + self._interval
+        if wait > 0:
+            time.sleep(wait)
+
+
+_rate_limiter = _RateLimiter(MAX_REQUESTS_PER_SECOND)
+
+
+def _check_config() -> bool:
+    """Return True if Google Group adds are configured (logs why not otherwise)."""
     if not GOOGLE_GROUP_EMAIL:
         logger.debug("GOOGLE_GROUP_EMAIL not set — skipping Google Group add")
         return False
@@ -48,62 +254,125 @@ def add_member_to_group(email: str) -> bool:
         )
         return False
 
-    try:
-        from google.oauth2 import service_account
-        from googleapiclient.discovery import build
-        from googleapiclient.errors import HttpError
+    return True
 
-        credentials = service_account.Credentials.from_service_account_file(
-            GOOGLE_SERVICE_ACCOUNT_PATH,
-            scopes=[ADMIN_SCOPE],
+
+def _handle_add_error(email: str, e: Exception) -> bool:
+    """
+    Log a failed members.insert and decide the outcome.
+    Returns True if the member is already in the group (409), else False.
+    """
+    if isinstance(e, HttpError):
+        status = e.resp.status
+        if status == 409:
+            logger.info(f"{email} is already a member of {GOOGLE_GROUP_EMAIL}")
+            return True
+        elif status == 403:
+            logger.error(
+                f"Permission denied adding {email} to Google Group. "
+                "Ensure domain-wide delegation is configured: "
+                "Google Workspace Admin → Security → API Controls → Domain-wide Delegation. "
+                f"Add scope: {ADMIN_SCOPE}"
+            )
+        elif status == 404:
+            logger.error(
+                f"Google Group {GOOGLE_GROUP_EMAIL} not found. "
+                "Check GOOGLE_GROUP_EMAIL env var."
+            )
+        else:
+            logger.error(f"HTTP error adding {email} to Google Group: {e}")
+        return False
+
+    if isinstance(e, RefreshError):
+        # Token exchange rejected, e.g. unauthorized_client / access_denied
+        logger.error(
+            f"Domain-wide delegation not configured or not authorized. "
+            f"Error: {e}. "
+            "Go to Google Workspace Admin → Security → API Controls → Domain-wide Delegation "
+            f"and add scope: {ADMIN_SCOPE}"
         )
-        delegated_credentials = credentials.with_subject(GOOGLE_ADMIN_EMAIL)
+    else:
+        logger.error(f"Error adding {email} to Google Group {GOOGLE_GROUP_EMAIL}: {e}")
+    return False
+
 
-        service = build("admin", "directory_v1", credentials=delegated_credentials)
+def add_member_to_group(email: str) -> bool:
+    """
+    Add a member to the configured Google Group via Admin SDK with DWD.
+
+    Returns True on success or if member already exists (idempotent).
+    Returns False on failure (logs descriptive error).
+    """
+    if not _check_config():
+        return False
 
-        service.members().insert(
+    try:
+        _get_service(GOOGLE_ADMIN_EMAIL).members().insert(
             groupKey=GOOGLE_GROUP_EMAIL,
             body={"email": email, "role": "MEMBER"},
-        ).execute()
+        ).execute(http=_authorized_http(GOOGLE_ADMIN_EMAIL))
 
         logger.info(f"Added {email} to Google Group {GOOGLE_GROUP_EMAIL}")
         return True
 
     except Exception as e:
-        # Import here to check the type — only available if google-api-python-client installed
-        try:
-            from googleapiclient.errors import HttpError
-            if isinstance(e, HttpError):
-                if e.resp.status == 409:
-                    logger.info(f"{email} is already a member of {GOOGLE_GROUP_EMAIL}")
-                    return True
-                elif e.resp.status == 403:
-                    logger.error(
-                        f"Permission denied adding {email} to Google Group. "
-                        "Ensure domain-wide delegation is configured: "
-                        "Google Workspace Admin → Security → API Controls → Domain-wide Delegation. "
-                        f"Add scope: {ADMIN_SCOPE}"
-                    )
-                    return False
-                elif e.resp.status == 404:
-                    logger.error(
-                        f"Google Group {GOOGLE_GROUP_EMAIL} not found. "
-                        "Check GOOGLE_GROUP_EMAIL env var."
-                    )
-                    return False
-                else:
-                    logger.error(f"HTTP error adding {email} to Google Group: {e}")
-                    return False
-        except ImportError:
-            pass
+        return _handle_add_error(email, e)
 
-        if "unauthorized_client" in str(e).lower() or "access_denied" in str(e).lower():
-            logger.error(
-                f"Domain-wide delegation not configured or not authorized. "
-                f"Error: {e}. "
-                "Go to Google Workspace Admin → Security → API Controls → Domain-wide Delegation "
-                f"and add scope: {ADMIN_SCOPE}"
-            )
+
+def add_members_to_group(emails: list[str]) -> dict[str, bool]:
+    """
+    Add several members to the configured Google Group in one batch HTTP call
+    per BATCH_LIMIT emails, instead of one round-trip each.
+
+    Returns {email: added_ok} with the same semantics as add_member_to_group.
+    """
+    results = {email: False for email in emails}
+    if not emails or not _check_config():
+        return results
+
+    def _callback(request_id, response, exception):
+        email = emails[int(request_id)]
+        if exception is None:
+            logger.info(f"Added {email} to Google Group {GOOGLE_GROUP_EMAIL}")
+            results[email] = True
         else:
-            logger.error(f"Error adding {email} to Google Group {GOOGLE_GROUP_EMAIL}: {e}")
-        return False
+            results[email] = _handle_add_error(email, exception)
+
+    for start in range(0, len(emails), BATCH_LIMIT):
+        chunk = range(start, min(start + BATCH_LIMIT, len(emails)))
+        try:
+            service = _get_service(GOOGLE_ADMIN_EMAIL)
+            batch = service.new_batch_http_request(callback=_callback)
+            for i in chunk:
+                batch.add(
+                    service.members().insert(
+                        groupKey=GOOGLE_GROUP_EMAIL,
+                        body={"email": emails[i], "role": "MEMBER"},
+                    ),
+                    request_id=str(i),
+                )
+            batch.execute(http=_authorized_http(GOOGLE_ADMIN_EMAIL))
+        except Exception as e:
+            _handle_add_error(f"{len(chunk)} members", e)
+
+    return results
+
+
+def add_members_to_group_parallel(emails: list[str], max_workers: int = 10) -> dict[str, bool]:
+    """
+    Add several members with concurrent single inserts, paced to
+    MAX_REQUESTS_PER_SECOND. Each worker thread uses its own HTTP connection.
+
+    add_members_to_group (one batch request) is preferred for large lists; this
+    variant isolates per-member failures when batches are noisy (e.g. many 409s).
+    Returns {email: added_ok}.
+    """
+    if not emails or not _check_config():
+        return {email: False for email in emails}
+
+    def _add(email: str) -> bool:
+        _rate_limiter.wait()
+        return add_member_to_group(email)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return dict(zip(emails, executor.map(_add, emails)))
@@ -4,70 +4,256 @@ Uses Python built-in smtplib with Gmail app password authentication.
 """
 
 import os
+import re
+import time
+import queue
+import random
 import logging
 import smtplib
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
+import threading
+from dataclasses import dataclass
+from functools import lru_cache
+from string import Template
+from email.message import EmailMessage
+from email.policy import SMTP as SMTP_POLICY
+
+import smtp_pool
 
 logger = logging.getLogger(__name__)
 
 SMTP_SERVER = "smtp.gmail.com"
 SMTP_PORT = 587
 
+POOL_CHECKOUT_TIMEOUT = 60  # seconds to wait for a free pooled connection
+MAX_SEND_ATTEMPTS = 4  # per message; transient failures back off 1s, 2s, 4s (+ jitter)
+MAX_BACKOFF = 60  # seconds, cap on a single backoff sleep
 
-def send_welcome_email(to_email: str, first_name: str, last_name: str,
-                        invite_link: str) -> bool:
+# Background send queue
+MAIL_QUEUE_SIZE = 1000
+SEND_RATE = 14  # max messages per second across all workers, Gmail's sustained sending guideline
+MAIL_WORKERS = 3  # concurrent senders, each on its own pooled connection (<= smtp_pool.POOL_SIZE)
+WORKER_IDLE_TIMEOUT = 30  # seconds without mail before a worker returns its connection
+OUTREACH_SEND_INTERVAL = 2.5  # seconds between queued cold outreach emails, same as campaign sends
+
+
+@dataclass(frozen=True)
+class _MailConfig:
+    sender: str
+    password: str
+    calendar_link: str
+
+
+@lru_cache(maxsize=1)
+def _config() -> _MailConfig:
     """
-    Send a welcome email with Slack workspace invite link.
-    Returns True if sent successfully.
+    Mail settings from the environment, read once on first use. Not read at
+    import: bot.py imports this module before load_dotenv() runs.
+    """
+    return _MailConfig(
+        sender=os.getenv("GMAIL_SENDER_ADDRESS", ""),
+        password=os.getenv("GMAIL_APP_PASSWORD", ""),
+        calendar_link=os.getenv("CALENDAR_LINK", ""),
+    )
+
+
+def shutdown_smtp_pool():
+    """Close every pooled SMTP connection (call on process exit)."""
+    smtp_pool.shutdown()
+
+
+class MailSession:
+    """
+    One pooled SMTP connection held across several sends.
+
+    The connection is acquired from the shared pool in __enter__ and
+    returned in __exit__, so each send() is just the MAIL/RCPT/DATA
+    exchange. If Gmail drops the connection, send() reconnects once and
+    retries.
+
+        with MailSession() as session:
+            send_welcome_email(..., session=session)
     """
-    sender = os.getenv("GMAIL_SENDER_ADDRESS")
-    password = os.getenv("GMAIL_APP_PASSWORD")
 
+    def __init__(self, sender: str = None, password: str = None):
+        self.sender = sender or _config().sender
+        self.password = password or _config().password
+        self._pool = None
+        self._conn = None
+
+    def __enter__(self):
+        self._acquire()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _acquire(self):
+        self._pool = smtp_pool.get_pool(SMTP_SERVER, SMTP_PORT, self.sender, self.password)
+        self._conn = self._pool.acquire(timeout=POOL_CHECKOUT_TIMEOUT)
+
+    def _reconnect(self):
+        conn, self._conn = self._conn, None
+        self._conn = self._pool.replace(conn)
+
+    def send(self, msg: EmailMessage):
+        """Send a built message to its To address, reconnecting once if dropped."""
+        if self._conn is None:
+            self._acquire()
+        if self._conn.msgs_sent >= smtp_pool.MAX_MSGS_PER_CONN:
+            self._reconnect()
+        try:
+            self._conn.send_message(msg, self.sender, [msg["To"]])
+        except smtplib.SMTPServerDisconnected:
+            logger.warning("SMTP connection dropped, reconnecting")
+            self._reconnect()
+            self._conn.send_message(msg, self.sender, [msg["To"]])
+        self._conn.msgs_sent += 1
+
+    def close(self):
+        if self._conn is None:
+            return
+        self._pool.release(self._conn)
+        self._conn = None
+
+
+def _credentials() -> tuple:
+    """Return (sender, password) from env, or (None, None) if not configured (logged)."""
+    sender, password = _config().sender, _config().password
     if not sender or not password:
         logger.error("Gmail credentials not configured (GMAIL_SENDER_ADDRESS / GMAIL_APP_PASSWORD)")
+        return None, None
+    return sender, password
+
+
+def _is_transient(e: Exception) -> bool:
+    """
+    True for failures worth retrying: 4xx replies (Gmail 421/450/451/454),
+    recipients refused only with 4xx codes (greylisting) and network errors
+    (drops, timeouts, refused connects). 5xx replies, a recipient refused
+    with 5xx and unsupported SMTP extensions are permanent.
+    """
+    if isinstance(e, smtplib.SMTPResponseException):
+        return 400 <= e.smtp_code < 500
+    if isinstance(e, smtplib.SMTPRecipientsRefused):
+        return bool(e.recipients) and all(400 <= code < 500 for code, _ in e.recipients.values())
+    if isinstance(e, smtplib.SMTPNotSupportedError):
         return False
+    return isinstance(e, OSError)  # SMTPServerDisconnected, socket timeouts, ...
 
-    if not to_email or not invite_link:
-        logger.error("Missing to_email or invite_link")
+
+def _backoff(attempt: int) -> float:
+    """Truncated exponential backoff with jitter: 2**attempt s (max MAX_BACKOFF) + 0-1s."""
+    return min(MAX_BACKOFF, 2 ** attempt) + random.random()
+
+
+def _send_mime(to_email: str, msg: EmailMessage, kind: str,
+               session: MailSession = None) -> bool:
+    """
+    Send a built message over `session`, or over a pooled connection if None.
+    Transient failures are retried up to MAX_SEND_ATTEMPTS times with
+    backoff; permanent ones fail at once. kind labels the log lines
+    ("Welcome", "Outreach"). Returns True if sent.
+    """
+    own_session = session is None
+    if own_session:
+        session = MailSession(msg["From"], _config().password)
+
+    try:
+        for attempt in range(MAX_SEND_ATTEMPTS):
+            try:
+                session.send(msg)
+                logger.info("%s email sent to %s", kind, to_email)
+                return True
+            except Exception as e:
+                if not _is_transient(e) or attempt + 1 == MAX_SEND_ATTEMPTS:
+                    logger.error("Failed to send %s email to %s: %s", kind.lower(), to_email, e)
+                    return False
+                # A 4xx reply leaves the connection usable; after a network
+                # error the next attempt checks out a fresh one
+                if not isinstance(e, (smtplib.SMTPResponseException, smtplib.SMTPRecipientsRefused)):
+                    session.close()
+                delay = _backoff(attempt)
+                logger.warning("Temporary SMTP failure for %s (%s), retrying in %.1fs",
+                               to_email, e, delay)
+                time.sleep(delay)
         return False
 
-    name = f"{first_name} {last_name}".strip() or "Member"
-    display_first = first_name or "there"
-    calendar_link = os.getenv("CALENDAR_LINK", "")
+    finally:
+        if own_session:
+            session.close()
 
-    subject = "RSG-Türkiye'ye Hoş Geldiniz! / Welcome to RSG-Türkiye!"
 
-    # Calendar section (only if link is configured)
-    calendar_html_tr = ""
-    calendar_html_en = ""
-    calendar_text_tr = ""
-    calendar_text_en = ""
-    if calendar_link:
-        calendar_html_tr = f"""
+WELCOME_SUBJECT = "RSG-Türkiye'ye Hoş Geldiniz! / Welcome to RSG-Türkiye!"
+
+# Social-media links shared by every email, filled into the templates at import
+_SOCIAL_LINKS_HTML = """\
+        <a href="https://www.linkedin.com/company/rsgturkey/posts/?feedView=all" style="text-decoration: none; display: inline-block; margin: 4px;">
+            <img src="https://cdn-icons-png.flaticon.com/32/3536/3536505.png" alt="LinkedIn" width="32" height="32" style="vertical-align: middle;">
+        </a>
+        <a href="https://www.instagram.com/rsgturkey/" style="text-decoration: none; display: inline-block; margin: 4px;">
+            <img src="https://cdn-icons-png.flaticon.com/32/2111/2111463.png" alt="Instagram" width="32" height="32" style="vertical-align: middle;">
+        </a>
+        <a href="https://x.com/RSGTurkey" style="text-decoration: none; display: inline-block; margin: 4px;">
+            <img src="https://cdn-icons-png.flaticon.com/32/5968/5968830.png" alt="X" width="32" height="32" style="vertical-align: middle;">
+        </a>
+        <a href="https://www.youtube.com/channel/UCRM_72rELTgtWK_zKlDGxxQ" style="text-decoration: none; display: inline-block; margin: 4px;">
+            <img src="https://cdn-icons-png.flaticon.com/32/1384/1384060.png" alt="YouTube" width="32" height="32" style="vertical-align: middle;">
+        </a>"""
+
+_SOCIAL_LINKS_TEXT = """\
+LinkedIn: https://www.linkedin.com/company/rsgturkey/posts/?feedView=all
+Instagram: https://www.instagram.com/rsgturkey/
+X (Twitter): https://x.com/RSGTurkey
+YouTube: https://www.youtube.com/channel/UCRM_72rELTgtWK_zKlDGxxQ"""
+
+
+# Whitespace runs that span a line break; in HTML any such run renders like one newline
+_HTML_LINE_WS_RE = re.compile(r"\s*\n\s*")
+
+
+def _static_template(source: str, minify_html: bool = False) -> Template:
+    """
+    Template for `source` with the shared social-media links already filled in.
+    minify_html drops indentation and blank lines while keeping one tag per
+    line, well under SMTP's 998-byte line limit.
+    """
+    source = Template(source).safe_substitute(
+        social_links_html=_SOCIAL_LINKS_HTML,
+        social_links_text=_SOCIAL_LINKS_TEXT,
+    )
+    if minify_html:
+        source = _HTML_LINE_WS_RE.sub("\n", source)
+    return Template(source)
+
+
+# Welcome email templates, parsed once at import. Only the invite link and the
+# optional calendar blocks vary between sends.
+_CALENDAR_HTML_TR_TMPL = _static_template("""
     <p>Dilerseniz etkinlik takvimimizi kendi takviminize de buradan entegre edebilirsiniz:</p>
     <p style="text-align: center; margin: 20px 0;">
-        <a href="{calendar_link}"
+        <a href="$calendar_link"
            style="background-color: #0B8043; color: white; padding: 10px 22px;
                   text-decoration: none; border-radius: 6px; font-size: 14px;
                   font-weight: bold; display: inline-block;">
             &#128197; RSG-T&uuml;rkiye Etkinlik Takvimi
         </a>
-    </p>"""
-        calendar_html_en = f"""
+    </p>""", minify_html=True)
+
+_CALENDAR_HTML_EN_TMPL = _static_template("""
     <p>You can also integrate our event calendar into your own calendar:</p>
     <p style="text-align: center; margin: 20px 0;">
-        <a href="{calendar_link}"
+        <a href="$calendar_link"
            style="background-color: #0B8043; color: white; padding: 10px 22px;
                   text-decoration: none; border-radius: 6px; font-size: 14px;
                   font-weight: bold; display: inline-block;">
             &#128197; RSG-T&uuml;rkiye Event Calendar
         </a>
-    </p>"""
-        calendar_text_tr = f"\nEtkinlik takvimimizi kendi takviminize entegre edebilirsiniz:\n{calendar_link}\n"
-        calendar_text_en = f"\nIntegrate our event calendar into yours:\n{calendar_link}\n"
+    </p>""", minify_html=True)
+
+_CALENDAR_TEXT_TR_TMPL = Template("\nEtkinlik takvimimizi kendi takviminize entegre edebilirsiniz:\n$calendar_link\n")
+_CALENDAR_TEXT_EN_TMPL = Template("\nIntegrate our event calendar into yours:\n$calendar_link\n")
 
-    html_body = f"""\
+_WELCOME_HTML_TMPL = _static_template("""\
 <html>
 <body style="font-family: Arial, sans-serif; max-width: 600px; margin: 0 auto; padding: 20px;">
     <h2>Merhabalar! &#10024;</h2>
@@ -92,29 +278,18 @@ def send_welcome_email(to_email: str, first_name: str, last_name: str,
     <p>Genel iletişim, etkinlik duyuruları ve toplantı bilgilerimizi paylaştığımız Slack kanalımıza seni de bekliyoruz. Katıldığında, formda se&ccedil;miş olduğun komite kanallarına otomatik olarak ekleneceksin.</p>
 
     <p style="text-align: center; margin: 30px 0;">
-        <a href="{invite_link}"
+        <a href="$invite_link"
            style="background-color: #4A154B; color: white; padding: 14px 28px;
                   text-decoration: none; border-radius: 6px; font-size: 16px;
                   font-weight: bold; display: inline-block;">
             &#128172; Slack Kanalına Katıl / Join Slack
         </a>
     </p>
-{calendar_html_tr}
+$calendar_html_tr
     <p>Bizi sosyal medya &uuml;zerinden takip ederek g&uuml;ncel ilan ve duyurulardan haberdar olabilirsin:</p>
 
     <p style="text-align: center; margin: 20px 0;">
-        <a href="https://www.linkedin.com/company/rsgturkey/posts/?feedView=all" style="text-decoration: none; display: inline-block; margin: 4px;">
-            <img src="https://cdn-icons-png.flaticon.com/32/3536/3536505.png" alt="LinkedIn" width="32" height="32" style="vertical-align: middle;">
-        </a>
-        <a href="https://www.instagram.com/rsgturkey/" style="text-decoration: none; display: inline-block; margin: 4px;">
-            <img src="https://cdn-icons-png.flaticon.com/32/2111/2111463.png" alt="Instagram" width="32" height="32" style="vertical-align: middle;">
-        </a>
-        <a href="https://x.com/RSGTurkey" style="text-decoration: none; display: inline-block; margin: 4px;">
-            <img src="https://cdn-icons-png.flaticon.com/32/5968/5968830.png" alt="X" width="32" height="32" style="vertical-align: middle;">
-        </a>
-        <a href="https://www.youtube.com/channel/UCRM_72rELTgtWK_zKlDGxxQ" style="text-decoration: none; display: inline-block; margin: 4px;">
-            <img src="https://cdn-icons-png.flaticon.com/32/1384/1384060.png" alt="YouTube" width="32" height="32" style="vertical-align: middle;">
-        </a>
+$social_links_html
     </p>
 
     <p>Herhangi bir sorunuz olursa l&uuml;tfen &ccedil;ekinmeden bizimle iletişime ge&ccedil;in. Sizlerle birlikte &ccedil;alışmak ve daha g&uuml;zel etkinlikler &uuml;retmek i&ccedil;in &ccedil;ok heyecanlıyız! &#127775;</p>
@@ -143,29 +318,18 @@ def send_welcome_email(to_email: str, first_name: str, last_name: str,
     <p>We use Slack for general communication, event announcements, and meeting schedules. Once you join, you'll be automatically added to the committee channels you selected in the registration form.</p>
 
     <p style="text-align: center; margin: 30px 0;">
-        <a href="{invite_link}"
+        <a href="$invite_link"
            style="background-color: #4A154B; color: white; padding: 14px 28px;
                   text-decoration: none; border-radius: 6px; font-size: 16px;
                   font-weight: bold; display: inline-block;">
             &#128172; Join Slack Workspace
         </a>
     </p>
-{calendar_html_en}
+$calendar_html_en
     <p>Follow us on social media to stay up to date with announcements and opportunities:</p>
 
     <p style="text-align: center; margin: 20px 0;">
-        <a href="https://www.linkedin.com/company/rsgturkey/posts/?feedView=all" style="text-decoration: none; display: inline-block; margin: 4px;">
-            <img src="https://cdn-icons-png.flaticon.com/32/3536/3536505.png" alt="LinkedIn" width="32" height="32" style="vertical-align: middle;">
-        </a>
-        <a href="https://www.instagram.com/rsgturkey/" style="text-decoration: none; display: inline-block; margin: 4px;">
-            <img src="https://cdn-icons-png.flaticon.com/32/2111/2111463.png" alt="Instagram" width="32" height="32" style="vertical-align: middle;">
-        </a>
-        <a href="https://x.com/RSGTurkey" style="text-decoration: none; display: inline-block; margin: 4px;">
-            <img src="https://cdn-icons-png.flaticon.com/32/5968/5968830.png" alt="X" width="32" height="32" style="vertical-align: middle;">
-        </a>
-        <a href="https://www.youtube.com/channel/UCRM_72rELTgtWK_zKlDGxxQ" style="text-decoration: none; display: inline-block; margin: 4px;">
-            <img src="https://cdn-icons-png.flaticon.com/32/1384/1384060.png" alt="YouTube" width="32" height="32" style="vertical-align: middle;">
-        </a>
+$social_links_html
     </p>
 
     <p>If you have any questions, please don't hesitate to reach out. We are very excited to work with you and create great events together! &#127775;</p>
@@ -174,9 +338,9 @@ def send_welcome_email(to_email: str, first_name: str, last_name: str,
 
     <p>ISCB-SC RSG-T&uuml;rkiye Ekibi adına / On behalf of the ISCB-SC RSG-T&uuml;rkiye Team</p>
 </body>
-</html>"""
+</html>""", minify_html=True)
 
-    text_body = f"""\
+_WELCOME_TEXT_TMPL = _static_template("""\
 Merhabalar!
 
 ISCB-SC RSG-Türkiye'ye gösterdiğin ilgi için teşekkür ederiz. Hesaplamalı biyoloji alanında Türkiye'deki en köklü öğrenci topluluklarından biri olarak, seni de aramızda görmekten mutluluk duyuyoruz!
@@ -196,13 +360,10 @@ Biz, 2011 yılından beri hiyerarşiden uzak, tamamen gönüllülük esasıyla 
 
 Genel iletişim, etkinlik duyuruları ve toplantı bilgilerimizi paylaştığımız Slack kanalımıza seni de bekliyoruz. Katıldığında, formda seçmiş olduğun komite kanallarına otomatik olarak ekleneceksin.
 
-Slack Kanalına Katıl: {invite_link}
-{calendar_text_tr}
+Slack Kanalına Katıl: $invite_link
+$calendar_text_tr
 Bizi sosyal medyadan takip edin:
-LinkedIn: https://www.linkedin.com/company/rsgturkey/posts/?feedView=all
-Instagram: https://www.instagram.com/rsgturkey/
-X (Twitter): https://x.com/RSGTurkey
-YouTube: https://www.youtube.com/channel/UCRM_72rELTgtWK_zKlDGxxQ
+$social_links_text
 
 Herhangi bir sorunuz olursa lütfen çekinmeden bizimle iletişime geçin. Sizlerle birlikte çalışmak ve daha güzel etkinlikler üretmek için çok heyecanlıyız!
 
@@ -227,122 +388,313 @@ Communication & Updates
 
 We use Slack for general communication, event announcements, and meeting schedules. Once you join, you'll be automatically added to the committee channels you selected in the registration form.
 
-Join Slack: {invite_link}
-{calendar_text_en}
+Join Slack: $invite_link
+$calendar_text_en
 Follow us on social media:
-LinkedIn: https://www.linkedin.com/company/rsgturkey/posts/?feedView=all
-Instagram: https://www.instagram.com/rsgturkey/
-X (Twitter): https://x.com/RSGTurkey
-YouTube: https://www.youtube.com/channel/UCRM_72rELTgtWK_zKlDGxxQ
+$social_links_text
 
 If you have any questions, please don't hesitate to reach out. We are very excited to work with you and create great events together!
 
 Best regards,
 
-ISCB-SC RSG-Türkiye Ekibi adına / On behalf of the ISCB-SC RSG-Türkiye Team"""
+ISCB-SC RSG-Türkiye Ekibi adına / On behalf of the ISCB-SC RSG-Türkiye Team""")
+
 
-    msg = MIMEMultipart("alternative")
+def _render_welcome(invite_link: str, calendar_link: str) -> tuple[str, str]:
+    """
+    Render the welcome (text, html) bodies. They don't depend on the
+    recipient; _welcome_parts caches the result per invite/calendar link.
+    """
+    # Calendar section (only if link is configured)
+    calendar_html_tr = ""
+    calendar_html_en = ""
+    calendar_text_tr = ""
+    calendar_text_en = ""
+    if calendar_link:
+        calendar_html_tr = _CALENDAR_HTML_TR_TMPL.substitute(calendar_link=calendar_link)
+        calendar_html_en = _CALENDAR_HTML_EN_TMPL.substitute(calendar_link=calendar_link)
+        calendar_text_tr = _CALENDAR_TEXT_TR_TMPL.substitute(calendar_link=calendar_link)
+        calendar_text_en = _CALENDAR_TEXT_EN_TMPL.substitute(calendar_link=calendar_link)
+
+    html_body = _WELCOME_HTML_TMPL.substitute(
+        invite_link=invite_link,
+        calendar_html_tr=calendar_html_tr,
+        calendar_html_en=calendar_html_en,
+    )
+    text_body = _WELCOME_TEXT_TMPL.substitute(
+        invite_link=invite_link,
+        calendar_text_tr=calendar_text_tr,
+        calendar_text_en=calendar_text_en,
+    )
+    return text_body, html_body
+
+
+@lru_cache(maxsize=4)
+def _welcome_parts(invite_link: str, calendar_link: str) -> tuple:
+    """
+    Encoded text/plain and text/html parts of the welcome email. Parts are never
+    modified after this, so every recipient's message can share them and the
+    bodies are encoded once instead of per send.
+    """
+    text_body, html_body = _render_welcome(invite_link, calendar_link)
+    body = EmailMessage(policy=SMTP_POLICY)
+    body.set_content(text_body)
+    # Sent as 8bit UTF-8 rather than quoted-printable, encoded once here
+    body.add_alternative(html_body.encode("utf-8"), "text", "html", cte="8bit", params={"charset": "utf-8"})
+    return tuple(body.iter_parts())
+
+
+def _assemble(to_email: str, subject: str, sender: str, parts: tuple) -> EmailMessage:
+    """Wrap prebuilt alternative parts in a multipart message with per-recipient headers."""
+    msg = EmailMessage(policy=SMTP_POLICY)
     msg["Subject"] = subject
     msg["From"] = sender
     msg["To"] = to_email
+    msg["MIME-Version"] = "1.0"
+    msg.make_alternative()
+    for part in parts:
+        msg.attach(part)
+    return msg
 
-    msg.attach(MIMEText(text_body, "plain"))
-    msg.attach(MIMEText(html_body, "html"))
 
-    try:
-        with smtplib.SMTP(SMTP_SERVER, SMTP_PORT) as server:
-            server.starttls()
-            server.login(sender, password)
-            server.sendmail(sender, to_email, msg.as_string())
+def _build_welcome_msg(to_email: str, first_name: str, last_name: str,
+                       invite_link: str, sender: str) -> EmailMessage:
+    """Build the bilingual welcome email with the Slack invite link."""
+    parts = _welcome_parts(invite_link, _config().calendar_link)
+    return _assemble(to_email, WELCOME_SUBJECT, sender, parts)
 
-        logger.info(f"Welcome email sent to {to_email}")
-        return True
 
-    except Exception as e:
-        logger.error(f"Failed to send email to {to_email}: {e}")
+def send_welcome_email(to_email: str, first_name: str, last_name: str,
+                        invite_link: str, session: MailSession = None) -> bool:
+    """
+    Send a welcome email with Slack workspace invite link.
+    Pass an open MailSession to reuse its connection; otherwise one is opened.
+    Returns True if sent successfully.
+    """
+    sender, _ = _credentials()
+    if not sender:
+        return False
+
+    if not to_email or not invite_link:
+        logger.error("Missing to_email or invite_link")
         return False
 
+    msg = _build_welcome_msg(to_email, first_name, last_name, invite_link, sender)
+    return _send_mime(to_email, msg, "Welcome", session)
 
-def send_outreach_email(to_email: str, subject: str, greeting: str,
-                         body: str) -> bool:
+
+def send_welcome_batch(recipients: list[tuple]) -> dict[str, bool]:
     """
-    Send a personalized outreach email.
-    greeting: full greeting line, e.g. "Sayın Prof. Dr. Tunahan Hocam,"
-    body: admin-composed text (plain text with newlines)
-    Returns True if sent successfully.
+    Send welcome emails concurrently through the background mail workers
+    (MAIL_WORKERS pooled connections, paced to SEND_RATE) and wait for all
+    of them to finish.
+    recipients: list of (to_email, first_name, last_name, invite_link)
+    Returns {to_email: sent_ok}.
     """
-    sender = os.getenv("GMAIL_SENDER_ADDRESS")
-    password = os.getenv("GMAIL_APP_PASSWORD")
+    results = {r[0]: False for r in recipients}
+    if not recipients or not _credentials()[0]:
+        return results
 
-    if not sender or not password:
-        logger.error("Gmail credentials not configured")
-        return False
+    finished = threading.Semaphore(0)
+    queued = 0
+    for to_email, first_name, last_name, invite_link in recipients:
+        def on_done(ok, to_email=to_email):
+            results[to_email] = ok
+            finished.release()
 
-    if not to_email:
-        logger.error("Missing to_email for outreach")
-        return False
+        if queue_welcome_email(to_email, first_name, last_name, invite_link, on_done=on_done):
+            queued += 1
+
+    for _ in range(queued):
+        finished.acquire()
+    return results
 
-    # Convert newlines to <br> for HTML body
-    body_html = body.replace("\n", "<br>")
 
-    html_body = f"""\
+# Outreach templates: a fixed shell around the greeting and admin-composed body
+_BR_TABLE = str.maketrans({"\n": "<br>"})
+_OUTREACH_HTML_TMPL = _static_template("""\
 <html>
 <body style="font-family: Arial, sans-serif; max-width: 600px; margin: 0 auto; padding: 20px;">
-    <p style="font-size: 16px;"><strong>{greeting}</strong></p>
+    <p style="font-size: 16px;"><strong>$greeting</strong></p>
 
-    <p>{body_html}</p>
+    <p>$body_html</p>
 
     <p style="text-align: center; margin: 20px 0;">
         Bizi sosyal medyadan takip edin / Follow us on social media:<br><br>
-        <a href="https://www.linkedin.com/company/rsgturkey/posts/?feedView=all" style="text-decoration: none; display: inline-block; margin: 4px;">
-            <img src="https://cdn-icons-png.flaticon.com/32/3536/3536505.png" alt="LinkedIn" width="32" height="32" style="vertical-align: middle;">
-        </a>
-        <a href="https://www.instagram.com/rsgturkey/" style="text-decoration: none; display: inline-block; margin: 4px;">
-            <img src="https://cdn-icons-png.flaticon.com/32/2111/2111463.png" alt="Instagram" width="32" height="32" style="vertical-align: middle;">
-        </a>
-        <a href="https://x.com/RSGTurkey" style="text-decoration: none; display: inline-block; margin: 4px;">
-            <img src="https://cdn-icons-png.flaticon.com/32/5968/5968830.png" alt="X" width="32" height="32" style="vertical-align: middle;">
-        </a>
-        <a href="https://www.youtube.com/channel/UCRM_72rELTgtWK_zKlDGxxQ" style="text-decoration: none; display: inline-block; margin: 4px;">
-            <img src="https://cdn-icons-png.flaticon.com/32/1384/1384060.png" alt="YouTube" width="32" height="32" style="vertical-align: middle;">
-        </a>
+$social_links_html
     </p>
 
     <hr style="border: none; border-top: 1px solid #ddd; margin: 20px 0;">
     <p style="color: #666; font-size: 12px;">ISCB-SC RSG-T&uuml;rkiye</p>
 </body>
-</html>"""
+</html>""", minify_html=True)
 
-    text_body = f"""{greeting}
+_OUTREACH_TEXT_TMPL = _static_template("""$greeting
 
-{body}
+$body
 
 ---
 Bizi sosyal medyadan takip edin / Follow us on social media:
-LinkedIn: https://www.linkedin.com/company/rsgturkey/posts/?feedView=all
-Instagram: https://www.instagram.com/rsgturkey/
-X (Twitter): https://x.com/RSGTurkey
-YouTube: https://www.youtube.com/channel/UCRM_72rELTgtWK_zKlDGxxQ
+$social_links_text
 
-ISCB-SC RSG-Türkiye"""
+ISCB-SC RSG-Türkiye""")
 
-    msg = MIMEMultipart("alternative")
-    msg["Subject"] = subject
-    msg["From"] = sender
-    msg["To"] = to_email
 
-    msg.attach(MIMEText(text_body, "plain"))
-    msg.attach(MIMEText(html_body, "html"))
+@lru_cache(maxsize=512)
+def _outreach_parts(greeting: str, body: str) -> tuple:
+    """
+    Encoded text/plain and text/html parts for one (greeting, body) pair.
+    A campaign sends one body to many recipients and greetings repeat
+    ("Dear Sir/Madam", one per department), so most sends reuse these.
+    """
+    # Convert newlines to <br> for HTML body
+    body_html = body.translate(_BR_TABLE)
 
-    try:
-        with smtplib.SMTP(SMTP_SERVER, SMTP_PORT) as server:
-            server.starttls()
-            server.login(sender, password)
-            server.sendmail(sender, to_email, msg.as_string())
+    html_body = _OUTREACH_HTML_TMPL.substitute(greeting=greeting, body_html=body_html)
+    text_body = _OUTREACH_TEXT_TMPL.substitute(greeting=greeting, body=body)
+
+    parts = EmailMessage(policy=SMTP_POLICY)
+    parts.set_content(text_body)
+    parts.add_alternative(html_body, subtype="html")
+    return tuple(parts.iter_parts())
+
+
+def _build_outreach_msg(to_email: str, subject: str, greeting: str,
+                        body: str, sender: str) -> EmailMessage:
+    """Build a personalized outreach email around the admin-composed body."""
+    return _assemble(to_email, subject, sender, _outreach_parts(greeting, body))
+
+
+def send_outreach_email(to_email: str, subject: str, greeting: str,
+                         body: str, session: MailSession = None) -> bool:
+    """
+    Send a personalized outreach email.
+    greeting: full greeting line, e.g. "Sayın Prof. Dr. Tunahan Hocam,"
+    body: admin-composed text (plain text with newlines)
+    Pass an open MailSession to reuse its connection; otherwise one is opened.
+    Returns True if sent successfully.
+    """
+    sender, _ = _credentials()
+    if not sender:
+        return False
+
+    if not to_email:
+        logger.error("Missing to_email for outreach")
+        return False
+
+    msg = _build_outreach_msg(to_email, subject, greeting, body, sender)
+    return _send_mime(to_email, msg, "Outreach", session)
+
+
+# Queued sends: (to_email, msg, kind, on_done) drained by MAIL_WORKERS background threads.
+# SMTP is one transaction at a time per connection, so concurrency comes from
+# several workers, each holding its own pooled connection.
+mail_queue: queue.Queue = queue.Queue(maxsize=MAIL_QUEUE_SIZE)
+_worker_threads: list[threading.Thread] = []
+_worker_lock = threading.Lock()
+_pace_lock = threading.Lock()
+_next_send_at = 0.0
+_next_outreach_at = 0.0
 
-        logger.info(f"Outreach email sent to {to_email}")
+
+def _pace(kind: str):
+    """
+    Block until the calling worker may send. All mail stays under SEND_RATE;
+    outreach emails additionally go out at most one per OUTREACH_SEND_INTERVAL.
+    """
+    global _next_send_at, _next_outreach_at
+    with _pace_lock:
+        now = time.monotonic()
+        send_at = max(now, _next_send_at)
+        _next_send_at = send_at + 1 / SEND_RATE
+        if kind == "Outreach":
+            send_at = max(send_at, _next_outreach_at)
+            _next_outreach_at = send_at + OUTREACH_SEND_INTERVAL
+    if send_at > now:
+        time.sleep(send_at - now)
+
+
+def _mail_worker():
+    """Drain mail_queue over one pooled connection per worker, pacing sends to SEND_RATE."""
+    session = None
+    while True:
+        try:
+            to_email, msg, kind, on_done = mail_queue.get(timeout=WORKER_IDLE_TIMEOUT)
+        except queue.Empty:
+            if session is not None:
+                session.close()
+            continue
+
+        try:
+            if session is None:
+                session = MailSession(msg["From"], _credentials()[1])
+
+            _pace(kind)
+            ok = _send_mime(to_email, msg, kind, session)
+
+            if on_done is not None:
+                try:
+                    on_done(ok)
+                except Exception as e:
+                    logger.error("Mail callback for %s failed: %s", to_email, e)
+        finally:
+            mail_queue.task_done()
+
+
+def _ensure_workers():
+    if _worker_threads:
+        return
+    with _worker_lock:
+        if not _worker_threads:
+            for i in range(MAIL_WORKERS):
+                thread = threading.Thread(target=_mail_worker, name=f"mail-worker-{i}", daemon=True)
+                thread.start()
+                _worker_threads.append(thread)
+
+
+def _enqueue(to_email: str, msg: EmailMessage, kind: str, on_done) -> bool:
+    _ensure_workers()
+    try:
+        mail_queue.put_nowait((to_email, msg, kind, on_done))
         return True
+    except queue.Full:
+        logger.error("Mail queue is full, dropping %s email to %s", kind, to_email)
+        return False
+
 
-    except Exception as e:
-        logger.error(f"Failed to send outreach email to {to_email}: {e}")
+def queue_welcome_email(to_email: str, first_name: str, last_name: str,
+                        invite_link: str, on_done=None) -> bool:
+    """
+    Queue a welcome email for the background sender instead of blocking on SMTP.
+    on_done(ok: bool) is called from the worker thread once the send finishes.
+    Returns True if the email was queued.
+    """
+    sender, _ = _credentials()
+    if not sender:
+        return False
+
+    if not to_email or not invite_link:
+        logger.error("Missing to_email or invite_link")
         return False
+
+    msg = _build_welcome_msg(to_email, first_name, last_name, invite_link, sender)
+    return _enqueue(to_email, msg, "Welcome", on_done)
+
+
+def queue_outreach_email(to_email: str, subject: str, greeting: str,
+                         body: str, on_done=None) -> bool:
+    """
+    Queue an outreach email for the background sender instead of blocking on SMTP.
+    on_done(ok: bool) is called from the worker thread once the send finishes.
+    Returns True if the email was queued.
+    """
+    sender, _ = _credentials()
+    if not sender:
+        return False
+
+    if not to_email:
+        logger.error("Missing to_email for outreach")
+        return False
+
+    msg = _build_outreach_msg(to_email, subject, greeting, body, sender)
+    return _enqueue(to_email, msg, "Outreach", on_done)
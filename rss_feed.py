@@ -9,9 +9,19 @@ Note: TUBITAK (Turkey) has no RSS feed for scholarship/call announcements.
 Monitor https://tubitak.gov.tr/en/announcements manually for BIDEB calls (2205, 2209, 2247-C).
 """
 
+import os
 import re
+import json
 import logging
+import tempfile
+import threading
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from urllib.parse import urlsplit
 from html import unescape
+from xml.etree import ElementTree
+from email.utils import parsedate_to_datetime
 from datetime import datetime, timezone, timedelta
 
 logger = logging.getLogger(__name__)
@@ -64,25 +74,61 @@ HEADERS = {
         "Mozilla/5.0 (X11; Linux x86_64) "
         "AppleWebKit/537.36 (KHTML, like Gecko) "
         "Chrome/120.0.0.0 Safari/537.36"
-    )
+    ),
+    "Accept-Encoding": "gzip, deflate",
 }
+FETCH_TIMEOUT = 15  # seconds
+
+# requests sessions are not guaranteed thread-safe, so each fetch thread keeps
+# its own keep-alive session instead of sharing one across the pool
+_thread_local = threading.local()
+
+
+def _get_session() -> requests.Session:
+    """Return this thread's requests session, created on first use."""
+    session = getattr(_thread_local, "session", None)
+    if session is None:
+        session = _thread_local.session = requests.Session()
+    return session
+
+
+_TAG_RE = re.compile(r"<[^>]+>")
+# "The post ... appeared first on ..." trailing text added by some feeds
+_TRAIL_RE = re.compile(r"\s*The post .+ appeared first on .+\.$", re.DOTALL)
 
 
 def _strip_html(text: str) -> str:
-    text = re.sub(r"<[^>]+>", "", text or "")
+    text = text or ""
+    # Plain-text titles/summaries skip the regexes entirely
+    if "<" in text:
+        text = _TAG_RE.sub("", text)
     text = unescape(text)
-    # Remove "The post ... appeared first on ..." trailing text added by some feeds
-    text = re.sub(r"\s*The post .+ appeared first on .+\.$", "", text, flags=re.DOTALL)
+    if "appeared first on" in text:
+        text = _TRAIL_RE.sub("", text)
     return text.strip()
 
 
+# One alternation per list, so a title is scanned once instead of once per phrase.
+# Plain substring semantics (no word boundaries), same as `phrase in title`.
+_KEYWORD_RE = re.compile("|".join(map(re.escape, KEYWORDS)), re.IGNORECASE)
+# Single-word keywords for a hashed fast path: a title word equal to one of
+# these is a match outright. A miss still needs the substring regex
+# ("resequencing" contains "sequencing"), so results are unchanged.
+_SINGLE_KEYWORDS = frozenset(kw for kw in KEYWORDS if " " not in kw)
+_WORD_RE = re.compile(r"[a-z0-9-]+")
+_BLACKLIST_RE = re.compile("|".join(map(re.escape, sorted(TITLE_BLACKLIST))), re.IGNORECASE)
+
+
 def _is_relevant(entry, check_blacklist: bool = True) -> bool:
-    title = _strip_html(entry.get("title") or "").lower()
-    # Reject seniority/unrelated patterns in the title (skip for training events)
-    if check_blacklist and any(b in title for b in TITLE_BLACKLIST):
+    title = _strip_html(entry.get("title") or "")
+    # Require a keyword match in the title (summary-only matches are too noisy).
+    # Checked first: most entries of the general feeds miss here, and then
+    # the blacklist scan is skipped.
+    words = _WORD_RE.findall(title.lower())
+    if _SINGLE_KEYWORDS.isdisjoint(words) and _KEYWORD_RE.search(title) is None:
         return False
-    # Require a keyword match in the title (summary-only matches are too noisy)
-    return any(kw in title for kw in KEYWORDS)
+    # Reject seniority/unrelated patterns in the title (skip for training events)
+    return not (check_blacklist and _BLACKLIST_RE.search(title))
 
 
 MAX_AGE_DAYS = 30  # skip entries older than this
@@ -100,31 +146,203 @@ def _is_recent(entry) -> bool:
         return True
 
 
-def _parse_feed(url: str, check_blacklist: bool = True, seen_guids: set = None) -> list[dict]:
-    """Parse a single RSS feed URL and return relevant entries."""
+# Per-feed ETag/Last-Modified validators plus the entries they describe, so an
+# unchanged feed costs one 304 response and no XML parsing.
+_CACHED_FIELDS = ("id", "link", "title", "summary", "published", "published_parsed", "updated_parsed")
+
+
+def _cache_path() -> str:
+    """RSS_CACHE_PATH, read when the cache is used: bot.py imports this module before load_dotenv()."""
+    return os.getenv("RSS_CACHE_PATH") or os.path.expanduser("~/.cache/meetpoll/rss.json")
+
+
+def _load_cache() -> dict:
+    try:
+        with open(_cache_path()) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_cache(cache: dict):
+    path = _cache_path()
+    try:
+        cache_dir = os.path.dirname(path)
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, prefix=".rss-")
+        with os.fdopen(fd, "w") as f:
+            json.dump(cache, f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning(f"Could not write RSS cache {path}: {e}")
+
+
+def _slim_entry(entry) -> dict:
+    """Keep only the fields the filters and results use (struct_time dates become lists in JSON)."""
+    return {k: entry.get(k) for k in _CACHED_FIELDS if entry.get(k)}
+
+
+_ATOM = "{http://www.w3.org/2005/Atom}"
+_DC = "{http://purl.org/dc/elements/1.1/}"
+
+
+def _parse_date(value: str, rfc822: bool):
+    """RFC 822 (RSS) or ISO 8601 (Atom) date -> UTC struct_time, like feedparser's *_parsed."""
+    if not value:
+        return None
+    try:
+        if rfc822:
+            dt = parsedate_to_datetime(value)
+        else:
+            dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except (TypeError, ValueError):
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc).timetuple()
+
+
+def _iter_entries(content: bytes):
+    """
+    Stream <item> (RSS 2.0) or <entry> (Atom) elements out of a feed with the
+    C expat parser, yielding feedparser-style dicts and clearing each element
+    once read. Raises ValueError for any other document type.
+    """
+    root = None
+    for event, elem in ElementTree.iterparse(BytesIO(content), events=("start", "end")):
+        if root is None:
+            root = elem.tag
+            if root not in ("rss", _ATOM + "feed"):
+                raise ValueError(f"unsupported feed root {root}")
+            continue
+        if event != "end":
+            continue
+
+        if elem.tag == "item":
+            published = (elem.findtext("pubDate") or "").strip()
+            # Items without <pubDate> are often dated by Dublin Core <dc:date>
+            # (ISO 8601), which feedparser reports as the updated date
+            dc_date = (elem.findtext(_DC + "date") or "").strip()
+            yield {
+                "id": (elem.findtext("guid") or "").strip(),
+                "link": (elem.findtext("link") or "").strip(),
+                "title": (elem.findtext("title") or "").strip(),
+                "summary": (elem.findtext("description") or "").strip(),
+                "published": published,
+                "published_parsed": _parse_date(published, rfc822=True),
+                "updated_parsed": _parse_date(dc_date, rfc822=False),
+            }
+            elem.clear()
+        elif elem.tag == _ATOM + "entry":
+            link = next((l.get("href") for l in elem.iter(_ATOM + "link")
+                         if l.get("rel", "alternate") == "alternate"), "")
+            published = (elem.findtext(_ATOM + "published") or "").strip()
+            updated = (elem.findtext(_ATOM + "updated") or "").strip()
+            summary = elem.findtext(_ATOM + "summary") or elem.findtext(_ATOM + "content") or ""
+            yield {
+                "id": (elem.findtext(_ATOM + "id") or "").strip(),
+                "link": link or "",
+                "title": (elem.findtext(_ATOM + "title") or "").strip(),
+                "summary": summary.strip(),
+                "published": published,
+                "published_parsed": _parse_date(published, rfc822=False),
+                "updated_parsed": _parse_date(updated, rfc822=False),
+            }
+            elem.clear()
+
+
+def _parse_entries(url: str, resp):
+    """
+    Parse a downloaded feed body. Plain RSS 2.0 / Atom goes through the
+    streaming parser; anything it can't read (RSS 1.0, malformed XML) falls
+    back to feedparser. Returns a list of entries, or None if unparseable.
+    """
+    try:
+        return list(_iter_entries(resp.content))
+    except (ElementTree.ParseError, ValueError):
+        pass
+
     import feedparser
-    if seen_guids is None:
-        seen_guids = set()
-    results = []
+    # Base URL and charset come from the real response, as if feedparser had fetched it.
+    # feedparser only looks up lowercase header names ("content-type").
+    headers = {name.lower(): value for name, value in resp.headers.items()}
+    feed = feedparser.parse(
+        resp.content,
+        response_headers={**headers, "content-location": resp.url},
+    )
+    if feed.bozo and not feed.entries:
+        logger.warning(f"RSS feed parse issue for {url}: {feed.bozo_exception}")
+        return None
+    return feed.entries
+
+
+def _fetch_feed(url: str, cached: dict) -> tuple:
+    """
+    Download and parse one feed, sending the validators from `cached`.
+    Returns (entries, cache_record); entries is None on error. On 304 Not
+    Modified the cached entries are returned as they are.
+    """
+    headers = dict(HEADERS)
+    if cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
+    if cached.get("modified"):
+        headers["If-Modified-Since"] = cached["modified"]
     try:
-        feed = feedparser.parse(url, request_headers=HEADERS)
+        resp = _get_session().get(url, headers=headers, timeout=FETCH_TIMEOUT)
+        if resp.status_code == 304:
+            return cached.get("entries", []), cached
+        resp.raise_for_status()
+        parsed = _parse_entries(url, resp)
     except Exception as e:
         logger.error(f"Error fetching RSS feed {url}: {e}")
-        return results
+        return None, cached
 
-    if feed.bozo and not feed.entries:
-        logger.warning(f"RSS feed parse issue for {url}: {feed.bozo_exception}")
-        return results
+    if parsed is None:
+        return None, cached
 
-    for entry in feed.entries:
+    entries = [_slim_entry(e) for e in parsed if _is_recent(e)]
+    record = {
+        "etag": resp.headers.get("ETag"),
+        "modified": resp.headers.get("Last-Modified"),
+        "entries": entries,
+    }
+    return entries, record
+
+
+def _canonical_guid(guid: str) -> str:
+    """
+    Normalize URL-shaped guids so the same post reached through different
+    feeds or share links compares equal: scheme/host case, "www.", fragment,
+    utm_* tracking parameters and a trailing slash are ignored.
+    """
+    parts = urlsplit(guid.strip())
+    if not parts.netloc:
+        return guid.strip()
+    host = parts.netloc.lower().removeprefix("www.")
+    query = "&".join(p for p in parts.query.split("&") if p and not p.startswith("utm_"))
+    return f"{host}{parts.path.rstrip('/')}?{query}"
+
+
+def _parse_feed(entries: list, check_blacklist: bool = True, seen_guids: set = None) -> list[dict]:
+    """
+    Return the relevant entries of an already fetched feed. seen_guids holds
+    hash(_canonical_guid(guid)) of entries already taken, shared across feeds.
+    """
+    if seen_guids is None:
+        seen_guids = set()
+    results = []
+    for entry in entries or ():
         if not _is_recent(entry):
             continue
         if not _is_relevant(entry, check_blacklist=check_blacklist):
             continue
         guid = entry.get("id") or entry.get("link") or ""
-        if not guid or guid in seen_guids:
+        if not guid:
             continue
-        seen_guids.add(guid)
+        key = hash(_canonical_guid(guid))
+        if key in seen_guids:
+            continue
+        seen_guids.add(key)
         results.append({
             "guid": guid,
             "title": entry.get("title") or "",
@@ -148,15 +366,23 @@ def fetch_bioinformatics_opportunities() -> list[dict]:
         logger.error("feedparser is not installed. Run: pip install feedparser>=6.0.0")
         return []
 
-    results = []
-    seen_guids = set()
-
-    for url in JOB_FEEDS + SCHOLARSHIP_FEEDS:
-        results.extend(_parse_feed(url, check_blacklist=True, seen_guids=seen_guids))
-
     # Training feeds: ELIXIR TeSS already filters by keyword server-side;
     # skip seniority blacklist since course/workshop titles don't have those patterns
-    for url in TRAINING_FEEDS:
-        results.extend(_parse_feed(url, check_blacklist=False, seen_guids=seen_guids))
+    feeds = [(url, True) for url in JOB_FEEDS + SCHOLARSHIP_FEEDS]
+    feeds += [(url, False) for url in TRAINING_FEEDS]
+
+    cache = _load_cache()
+
+    # Downloads are network-bound, so fetch all feeds at once; filtering,
+    # dedup and cache updates stay on this thread, in feed order.
+    with ThreadPoolExecutor(max_workers=len(feeds)) as pool:
+        fetched = list(pool.map(lambda f: _fetch_feed(f[0], cache.get(f[0], {})), feeds))
+
+    results = []
+    seen_guids = set()
+    for (url, check_blacklist), (entries, record) in zip(feeds, fetched):
+        cache[url] = record
+        results.extend(_parse_feed(entries, check_blacklist=check_blacklist, seen_guids=seen_guids))
 
+    _save_cache(cache)
     return results
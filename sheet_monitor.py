@@ -18,7 +18,7 @@ from datetime import datetime, timedelta
 from typing import Optional
 
 import database as db
-from sheets import _get_service
+from sheets import _get_values
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +38,7 @@ COL_ETKINLIK    = 0
 COL_TARIH       = 1
 COL_DEADLINE    = 2
 COL_TAMAMLANDI  = 3
+TAB_COLUMNS     = "A:D"  # only the four columns above are read
 
 
 # ---------------------------------------------------------------------------
@@ -51,14 +52,7 @@ def _fetch_tab(tab_name: str) -> list[dict]:
         return []
 
     try:
-        service = _get_service()
-        result = (
-            service.spreadsheets()
-            .values()
-            .get(spreadsheetId=COMMITTEE_SHEET_ID, range=f"'{tab_name}'")
-            .execute()
-        )
-        raw_rows = result.get("values", [])
+        raw_rows = _get_values(COMMITTEE_SHEET_ID, f"'{tab_name}'!{TAB_COLUMNS}")
         if len(raw_rows) < 2:
             return []
 
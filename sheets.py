@@ -6,13 +6,21 @@ Uses a service account for authentication (free, no billing needed).
 import os
 import logging
 import re
-
+import sys
+import time
+import threading
+from functools import lru_cache, wraps
+from typing import Iterator
+from urllib.parse import quote
+
+from google.auth.transport.requests import AuthorizedSession
 from google.oauth2.service_account import Credentials
-from googleapiclient.discovery import build
 
 logger = logging.getLogger(__name__)
 
 SCOPES = ["https://www.googleapis.com/auth/spreadsheets.readonly"]
+SHEETS_API_URL = "https://sheets.googleapis.com/v4/spreadsheets"
+HTTP_TIMEOUT = 30  # seconds per Sheets API request
 
 # Committee name mapping: form values (with emojis) → normalized English keys
 COMMITTEE_MAP = {
@@ -35,106 +43,221 @@ COMMITTEE_MAP = {
     "Grafik Tasarım / Graphic Design": "Graphic Design",
     "Graphic Design": "Graphic Design",
 }
+# One shared string object per committee name, so everything derived from the
+# map (the lookup table, memoized normalize_committee results) compares by identity
+COMMITTEE_MAP = {form_key: sys.intern(normalized) for form_key, normalized in COMMITTEE_MAP.items()}
+
+
+_EMOJI_RE = re.compile(
+    "["
+    "\U0001F600-\U0001F64F"
+    "\U0001F300-\U0001F5FF"
+    "\U0001F680-\U0001F6FF"
+    "\U0001F1E0-\U0001F1FF"
+    "\U00002702-\U000027B0"
+    "\U000024C2-\U0001F251"
+    "\U0001F900-\U0001F9FF"
+    "\U0001FA00-\U0001FA6F"
+    "\U0001FA70-\U0001FAFF"
+    "\U00002600-\U000026FF"
+    "\U0000FE00-\U0000FE0F"
+    "\U0000200D"
+    "\U00002B50"
+    "\U000023F0-\U000023FF"
+    "\U0000270A-\U0000270D"
+    "\U000025A0-\U000025FF"
+    "]+",
+    flags=re.UNICODE,
+)
 
 
 def _strip_emojis(text: str) -> str:
     """Remove emoji characters from a string."""
-    emoji_pattern = re.compile(
-        "["
-        "\U0001F600-\U0001F64F"
-        "\U0001F300-\U0001F5FF"
-        "\U0001F680-\U0001F6FF"
-        "\U0001F1E0-\U0001F1FF"
-        "\U00002702-\U000027B0"
-        "\U000024C2-\U0001F251"
-        "\U0001F900-\U0001F9FF"
-        "\U0001FA00-\U0001FA6F"
-        "\U0001FA70-\U0001FAFF"
-        "\U00002600-\U000026FF"
-        "\U0000FE00-\U0000FE0F"
-        "\U0000200D"
-        "\U00002B50"
-        "\U000023F0-\U000023FF"
-        "\U0000270A-\U0000270D"
-        "\U000025A0-\U000025FF"
-        "]+",
-        flags=re.UNICODE,
-    )
-    return emoji_pattern.sub("", text).strip()
+    # Every stripped range is above U+200D, so ASCII text has nothing to remove
+    if text.isascii():
+        return text.strip()
+    return _EMOJI_RE.sub("", text).strip()
+
 
+# Lowercased forms of COMMITTEE_MAP, prepared once for normalize_committee
+_COMMITTEE_ENGLISH = [
+    (form_key.split(" / ", 1)[1].lower(), normalized)
+    for form_key, normalized in COMMITTEE_MAP.items() if " / " in form_key
+]
+_COMMITTEE_KEYS_LOWER = [(form_key.lower(), normalized) for form_key, normalized in COMMITTEE_MAP.items()]
 
+
+def _match_committee(stripped_lower: str):
+    """Case-insensitive fallbacks: English part after " / ", then substring. None if no match."""
+    for english_part, normalized in _COMMITTEE_ENGLISH:
+        if english_part == stripped_lower:
+            return normalized
+    for key_lower, normalized in _COMMITTEE_KEYS_LOWER:
+        if stripped_lower in key_lower or key_lower in stripped_lower:
+            return normalized
+    return None
+
+
+# Answers for every lowercased form key, English part and normalized name, so
+# the usual form values resolve with one dict lookup instead of the scans
+_COMMITTEE_LOOKUP = {
+    candidate: _match_committee(candidate)
+    for form_key, normalized in COMMITTEE_MAP.items()
+    for candidate in (form_key.lower(), form_key.split(" / ", 1)[-1].lower(), normalized.lower())
+}
+
+
+@lru_cache(maxsize=256)
 def normalize_committee(raw: str) -> str:
-    """Normalize a committee name from form data to a standard key."""
+    """
+    Normalize a committee name from form data to a standard key.
+    Memoized: every row repeats the same handful of committee strings.
+    """
     stripped = _strip_emojis(raw).strip()
     # Exact match first
     if stripped in COMMITTEE_MAP:
         return COMMITTEE_MAP[stripped]
-    # Try matching the English portion after " / "
-    for form_key, normalized in COMMITTEE_MAP.items():
-        if " / " in form_key:
-            english_part = form_key.split(" / ", 1)[1]
-            if english_part.lower() == stripped.lower():
-                return normalized
-    # Substring match
     stripped_lower = stripped.lower()
-    for form_key, normalized in COMMITTEE_MAP.items():
-        if stripped_lower in form_key.lower() or form_key.lower() in stripped_lower:
-            return normalized
+    if stripped_lower in _COMMITTEE_LOOKUP:
+        return _COMMITTEE_LOOKUP[stripped_lower]
     # Return cleaned version as-is if no match
-    return stripped
+    return _match_committee(stripped_lower) or stripped
+
 
+# requests sessions are not guaranteed thread-safe, so each scheduler thread
+# keeps its own; the service account key is read once per process
+_thread_local = threading.local()
 
-def _get_service():
-    """Build the Google Sheets API service."""
+
+@lru_cache(maxsize=1)
+def _get_credentials():
     creds_path = os.getenv("GOOGLE_SERVICE_ACCOUNT_PATH", "./service_account.json")
-    creds = Credentials.from_service_account_file(creds_path, scopes=SCOPES)
-    return build("sheets", "v4", credentials=creds, cache_discovery=False)
+    return Credentials.from_service_account_file(creds_path, scopes=SCOPES)
 
 
-def fetch_registrations() -> list[dict]:
+def _get_session() -> AuthorizedSession:
+    """Return this thread's authorized HTTP session for direct Sheets API calls."""
+    session = getattr(_thread_local, "session", None)
+    if session is None:
+        session = _thread_local.session = AuthorizedSession(_get_credentials())
+    return session
+
+
+def _get_values(sheet_id: str, range_name: str) -> list[list]:
+    """Read one range with a plain values.get request, skipping the discovery-built client."""
+    response = _get_session().get(
+        f"{SHEETS_API_URL}/{sheet_id}/values/{quote(range_name, safe='')}",
+        timeout=HTTP_TIMEOUT,
+    )
+    response.raise_for_status()
+    return response.json().get("values", [])
+
+
+FETCH_CACHE_TTL = 60  # seconds a sheet read is reused, e.g. across one outreach preview + send
+
+
+def _ttl_cache(ttl_seconds: float):
     """
-    Fetch all registration rows from the Google Sheet.
-    Returns a list of dicts with normalized keys.
+    Reuse a zero-argument fetch's result for ttl_seconds. Empty results (sheet
+    not configured, or the read failed) are not cached, so the next call retries.
+    Callers get a copy of the cached list. wrapper.cache_clear() drops the entry.
+    """
+    def decorator(func):
+        expires_at = 0.0
+        cached = None
+
+        @wraps(func)
+        def wrapper():
+            nonlocal expires_at, cached
+            if cached is not None and time.monotonic() < expires_at:
+                return list(cached)
+            value = func()
+            if value:
+                cached, expires_at = value, time.monotonic() + ttl_seconds
+            return list(value)
+
+        def cache_clear():
+            nonlocal cached
+            cached = None
+
+        wrapper.cache_clear = cache_clear
+        return wrapper
+    return decorator
+
+
+def _used_columns(headers: list, field_for) -> list[tuple[int, str]]:
+    """
+    Pair each column index with the field field_for(header) maps it to, leaving out
+    unused columns (timestamps, notes, ...) so the row loops never visit them.
+    """
+    columns = []
+    for i, header in enumerate(headers):
+        field = field_for(str(header))
+        if field is not None:
+            columns.append((i, field))
+    return columns
+
+
+def _iter_records(rows: list[list], normalize, classify) -> Iterator[dict]:
+    """
+    Yield raw sheet rows (header row first) as normalized dicts, skipping rows without an email.
+    classify maps the headers to fields once; normalize(row, col_map) then reads cells by position.
+    """
+    if len(rows) < 2:
+        return
+
+    col_map = classify(rows[0])
+    for row in rows[1:]:
+        normalized = normalize(row, col_map)
+        if normalized and normalized.get("email"):
+            yield normalized
+
+
+def _to_records(rows: list[list], normalize, classify) -> list[dict]:
+    """List form of _iter_records."""
+    return list(_iter_records(rows, normalize, classify))
+
+
+def iter_registrations() -> Iterator[dict]:
+    """
+    Yield registration rows from the Google Sheet one at a time, with normalized keys.
+    For callers that walk the rows once; the normalized dicts are not kept around.
+    Yields nothing if the sheet is not configured or the read fails.
     """
     sheet_id = os.getenv("GOOGLE_SHEET_ID")
     sheet_name = os.getenv("GOOGLE_SHEET_NAME", "Form Responses 1")
 
     if not sheet_id:
         logger.error("GOOGLE_SHEET_ID not set")
-        return []
+        return
 
     try:
-        service = _get_service()
-        result = (
-            service.spreadsheets()
-            .values()
-            .get(spreadsheetId=sheet_id, range=sheet_name)
-            .execute()
-        )
-
-        rows = result.get("values", [])
-        if len(rows) < 2:
-            return []
-
-        headers = rows[0]
-        registrations = []
-
-        for row in rows[1:]:
-            # Pad row to match header length
-            padded = row + [""] * (len(headers) - len(row))
-            raw = dict(zip(headers, padded))
-            normalized = _normalize_row(raw)
-            if normalized and normalized.get("email"):
-                registrations.append(normalized)
-
-        logger.info(f"Fetched {len(registrations)} registrations from Google Sheet")
-        return registrations
+        rows = _get_values(sheet_id, sheet_name)
+    except Exception as e:
+        logger.error(f"Error fetching registrations: {e}")
+        return
 
+    count = 0
+    for registration in _iter_records(rows, _normalize_row, _classify_headers):
+        count += 1
+        yield registration
+    logger.info(f"Fetched {count} registrations from Google Sheet")
+
+
+@_ttl_cache(FETCH_CACHE_TTL)
+def fetch_registrations() -> list[dict]:
+    """
+    Fetch all registration rows from the Google Sheet.
+    Returns a list of dicts with normalized keys.
+    """
+    try:
+        return list(iter_registrations())
     except Exception as e:
         logger.error(f"Error fetching registrations: {e}")
         return []
 
 
+@_ttl_cache(FETCH_CACHE_TTL)
 def fetch_outreach_academics() -> list[dict]:
     """
     Fetch academic contacts from the outreach academics Google Sheet.
@@ -148,27 +271,9 @@ def fetch_outreach_academics() -> list[dict]:
         return []
 
     try:
-        service = _get_service()
-        result = (
-            service.spreadsheets()
-            .values()
-            .get(spreadsheetId=sheet_id, range=sheet_name)
-            .execute()
-        )
-
-        rows = result.get("values", [])
-        if len(rows) < 2:
-            return []
-
-        headers = rows[0]
-        contacts = []
-        for row in rows[1:]:
-            padded = row + [""] * (len(headers) - len(row))
-            raw = dict(zip(headers, padded))
-            normalized = _normalize_academic_row(raw)
-            if normalized and normalized.get("email"):
-                contacts.append(normalized)
+        rows = _get_values(sheet_id, sheet_name)
 
+        contacts = _to_records(rows, _normalize_academic_row, _classify_academic_headers)
         logger.info(f"Fetched {len(contacts)} academic contacts from Google Sheet")
         return contacts
 
@@ -177,6 +282,7 @@ def fetch_outreach_academics() -> list[dict]:
         return []
 
 
+@_ttl_cache(FETCH_CACHE_TTL)
 def fetch_outreach_clubs() -> list[dict]:
     """
     Fetch club contacts from the outreach clubs Google Sheet.
@@ -190,27 +296,9 @@ def fetch_outreach_clubs() -> list[dict]:
         return []
 
     try:
-        service = _get_service()
-        result = (
-            service.spreadsheets()
-            .values()
-            .get(spreadsheetId=sheet_id, range=sheet_name)
-            .execute()
-        )
-
-        rows = result.get("values", [])
-        if len(rows) < 2:
-            return []
-
-        headers = rows[0]
-        contacts = []
-        for row in rows[1:]:
-            padded = row + [""] * (len(headers) - len(row))
-            raw = dict(zip(headers, padded))
-            normalized = _normalize_club_row(raw)
-            if normalized and normalized.get("email"):
-                contacts.append(normalized)
+        rows = _get_values(sheet_id, sheet_name)
 
+        contacts = _to_records(rows, _normalize_club_row, _classify_club_headers)
         logger.info(f"Fetched {len(contacts)} club contacts from Google Sheet")
         return contacts
 
@@ -219,29 +307,97 @@ def fetch_outreach_clubs() -> list[dict]:
         return []
 
 
-def _normalize_academic_row(raw: dict) -> dict:
-    """Normalize an academic contact row. Handles Turkish/English column names.
-    Supports both combined 'Ad Soyad' and separate 'Ad'/'Soyad' columns.
-    """
+# Exact (lowercased) header names per outreach contact field
+_ACADEMIC_EMAIL_KEYS = frozenset({"e-posta", "email", "e-mail", "mail"})
+_ACADEMIC_FULL_NAME_KEYS = frozenset({"ad soyad", "ad-soyad", "isim", "name", "full name"})
+_ACADEMIC_FIRST_NAME_KEYS = frozenset({"ad", "first name", "first_name"})
+_ACADEMIC_LAST_NAME_KEYS = frozenset({"soyad", "last name", "last_name", "family name", "soyisim"})
+_ACADEMIC_TITLE_KEYS = frozenset({"unvan", "\u00fcnvan", "title", "academic title"})
+_ACADEMIC_INSTITUTION_KEYS = frozenset({"\u00fcniversite", "kurum", "institution", "university"})
+
+_CLUB_NAME_KEYS = frozenset({"kulüp adı", "club name", "club", "kulüp"})
+_CLUB_UNIVERSITY_KEYS = frozenset({"üniversite", "university", "uni"})
+_CLUB_FIELD_KEYS = frozenset({"alan", "field", "area"})
+_CLUB_NOTES_KEYS = frozenset({"notlar", "notes", "not"})
+_CLUB_CONTACT_KEYS = frozenset({"iletişim kişisi", "contact person", "contact", "kişi"})
+
+
+@lru_cache(maxsize=64)
+def _academic_field(key: str):
+    """Map an academic contacts header (Turkish or English) to its field name, or None."""
+    key_lower = key.lower().strip()
+
+    if key_lower in _ACADEMIC_EMAIL_KEYS:
+        return "email"
+    elif key_lower in _ACADEMIC_FULL_NAME_KEYS:
+        return "full_name"
+    elif key_lower in _ACADEMIC_FIRST_NAME_KEYS:
+        return "first_name"
+    elif key_lower in _ACADEMIC_LAST_NAME_KEYS:
+        return "last_name"
+    elif key_lower in _ACADEMIC_TITLE_KEYS:
+        return "title"
+    elif key_lower in _ACADEMIC_INSTITUTION_KEYS:
+        return "institution"
+    return None
+
+
+def _classify_academic_headers(headers: list) -> list[tuple[int, str]]:
+    """(column index, field) for each used academic contacts column, worked out once per sheet read."""
+    return _used_columns(headers, _academic_field)
+
+
+@lru_cache(maxsize=64)
+def _club_field(key: str):
+    """Map a club contacts header (Turkish or English) to its field name, or None."""
+    key_lower = key.lower().strip()
+
+    if "email" in key_lower or "e-posta" in key_lower or "eposta" in key_lower:
+        return "email"
+    elif key_lower in _CLUB_NAME_KEYS:
+        return "club_name"
+    elif key_lower in _CLUB_UNIVERSITY_KEYS:
+        return "university"
+    elif key_lower in _CLUB_FIELD_KEYS:
+        return "field"
+    elif "instagram" in key_lower or "sosyal medya" in key_lower or "social media" in key_lower:
+        return "social_media"
+    elif key_lower in _CLUB_NOTES_KEYS:
+        return "notes"
+    elif key_lower in _CLUB_CONTACT_KEYS:
+        return "contact_person"
+    return None
+
+
+def _classify_club_headers(headers: list) -> list[tuple[int, str]]:
+    """(column index, field) for each used club contacts column, worked out once per sheet read."""
+    return _used_columns(headers, _club_field)
+
+
+def _lower_email(email: str) -> str:
+    """Lowercase an email, skipping the copy when the form already stored it lowercase."""
+    return email if email.islower() else email.lower()
+
+
+def _contact_fields(row: list, col_map: list) -> dict:
+    """Non-empty, stripped cells of an outreach contact row keyed by field; email lowercased."""
     normalized = {}
-    for key, value in raw.items():
-        key_lower = key.lower().strip()
+    for i, field in col_map:
+        if i >= len(row):
+            continue
+        value = row[i]
         val = str(value).strip() if value else ""
         if not val:
             continue
+        normalized[field] = _lower_email(val) if field == "email" else val
+    return normalized
+
 
-        if key_lower in ("e-posta", "email", "e-mail", "mail"):
-            normalized["email"] = val.lower()
-        elif key_lower in ("ad soyad", "ad-soyad", "isim", "name", "full name"):
-            normalized["full_name"] = val
-        elif key_lower in ("ad", "first name", "first_name"):
-            normalized["first_name"] = val
-        elif key_lower in ("soyad", "last name", "last_name", "family name", "soyisim"):
-            normalized["last_name"] = val
-        elif key_lower in ("unvan", "\u00fcnvan", "title", "academic title"):
-            normalized["title"] = val
-        elif key_lower in ("\u00fcniversite", "kurum", "institution", "university"):
-            normalized["institution"] = val
+def _normalize_academic_row(row: list, col_map: list) -> dict:
+    """Normalize an academic contact row. Handles Turkish/English column names.
+    Supports both combined 'Ad Soyad' and separate 'Ad'/'Soyad' columns.
+    """
+    normalized = _contact_fields(row, col_map)
 
     # If we have a combined full_name but no separate first/last, keep full_name as-is
     # If we have separate first/last but no full_name, combine them
@@ -252,35 +408,20 @@ def _normalize_academic_row(raw: dict) -> dict:
     return normalized
 
 
-def _normalize_club_row(raw: dict) -> dict:
+def _normalize_club_row(row: list, col_map: list) -> dict:
     """Normalize a club contact row. Handles Turkish/English column names."""
-    normalized = {}
-    for key, value in raw.items():
-        key_lower = key.lower().strip()
-        val = str(value).strip() if value else ""
-        if not val:
-            continue
+    return _contact_fields(row, col_map)
 
-        if "email" in key_lower or "e-posta" in key_lower or "eposta" in key_lower:
-            normalized["email"] = val.lower()
-        elif key_lower in ("kulüp adı", "club name", "club", "kulüp"):
-            normalized["club_name"] = val
-        elif key_lower in ("üniversite", "university", "uni"):
-            normalized["university"] = val
-        elif key_lower in ("alan", "field", "area"):
-            normalized["field"] = val
-        elif "instagram" in key_lower or "sosyal medya" in key_lower or "social media" in key_lower:
-            normalized["social_media"] = val
-        elif key_lower in ("notlar", "notes", "not"):
-            normalized["notes"] = val
-        elif key_lower in ("iletişim kişisi", "contact person", "contact", "kişi"):
-            normalized["contact_person"] = val
 
-    return normalized
+_COMMITTEE_SEP_RE = re.compile(r"[;,]")  # committee answers use either separator
 
 
-def _normalize_row(raw: dict) -> dict:
-    """Normalize a raw sheet row into a standard dict."""
+@lru_cache(maxsize=64)
+def _registration_field(key: str):
+    """
+    Map a registration form header to its normalized field name, or None if unused.
+    Memoized: the form's headers are the same on every read.
+    """
     # Actual column headers from the form:
     #   [0] Timestamp
     #   [1] Email Address
@@ -291,37 +432,57 @@ def _normalize_row(raw: dict) -> dict:
     #   [6] Tüm okul bilgileri / All affiliations
     #   [7] Üyelik seçimi / Membership choice (...)
     #   [8] Hangi aktif üye grubuna/gruplarına... (committees)
+    # casefold() still turns "İ" into "i" + U+0307 (combining dot), so drop the dot
+    # to let Turkish headers like "SOYİSİM" match their ASCII keywords
+    key_lower = key.strip().casefold().replace("\u0307", "")
+
+    if key_lower == "timestamp":
+        return "sheet_timestamp"
+    elif "email" in key_lower and "name" not in key_lower:
+        return "email"
+    elif ("/ name" in key_lower and "family" not in key_lower
+          and "last" not in key_lower):
+        return "first_name"
+    elif ("family name" in key_lower or "soyisim" in key_lower
+          or "soyad" in key_lower or "last name" in key_lower):
+        return "last_name"
+    elif "ülke" in key_lower or "country" in key_lower:
+        return "country"
+    elif "eğitim" in key_lower or "education" in key_lower:
+        return "education"
+    elif ("affiliation" in key_lower or "okul bilgileri" in key_lower
+          or "bağlılık" in key_lower or "kuruluş" in key_lower):
+        return "affiliations"
+    elif "üyelik" in key_lower or "membership" in key_lower:
+        return "membership_choice"
+    elif ("grup" in key_lower or "group" in key_lower
+          or "komite" in key_lower or "committee" in key_lower):
+        return "committees"
+    return None
+
+
+def _classify_headers(headers: list) -> list[tuple[int, str]]:
+    """(column index, field) for each used registration column, worked out once per sheet read."""
+    return _used_columns(headers, _registration_field)
+
+
+def _normalize_row(row: list, col_map: list) -> dict:
+    """Normalize a raw sheet row into a standard dict, reading cells by column index."""
     normalized = {}
 
-    for key, value in raw.items():
-        key_lower = key.lower().strip()
+    for i, field in col_map:
+        value = row[i] if i < len(row) else ""
         val = str(value).strip() if value else ""
 
-        if key_lower == "timestamp":
-            normalized["sheet_timestamp"] = val
-        elif "email" in key_lower and "name" not in key_lower:
-            normalized["email"] = val.lower()
-        elif ("/ name" in key_lower and "family" not in key_lower
-              and "last" not in key_lower):
-            normalized["first_name"] = val
-        elif ("family name" in key_lower or "soyisim" in key.lower().replace("i̇", "i")
-              or "soyad" in key_lower or "last name" in key_lower):
-            normalized["last_name"] = val
-        elif "ülke" in key_lower or "country" in key_lower:
-            normalized["country"] = val
-        elif "eğitim" in key_lower or "education" in key_lower:
-            normalized["education"] = val
-        elif ("affiliation" in key_lower or "okul bilgileri" in key_lower
-              or "bağlılık" in key_lower or "kuruluş" in key_lower):
-            normalized["affiliations"] = val
-        elif "üyelik" in key_lower or "membership" in key_lower:
-            normalized["membership_choice"] = val
-        elif ("grup" in key_lower or "group" in key_lower
-              or "komite" in key_lower or "committee" in key_lower):
+        if field == "email":
+            normalized["email"] = _lower_email(val)
+        elif field == "committees":
             # Committees are comma-separated or semicolon-separated
             if val:
-                raw_committees = re.split(r"[;,]", val)
+                raw_committees = val.split(",") if ";" not in val else _COMMITTEE_SEP_RE.split(val)
                 committees = [normalize_committee(c.strip()) for c in raw_committees if c.strip()]
                 normalized["committees"] = ", ".join(committees)
+        else:
+            normalized[field] = val
 
     return normalized
@@ -0,0 +1,186 @@
+"""
+Pool of authenticated SMTP connections shared by the mailer.
+
+Connecting, STARTTLS and AUTH against smtp.gmail.com cost several round-trips,
+so connections are kept open and reused across sends. A background keepalive
+thread NOOPs idle connections so Gmail doesn't drop them between bursts.
+"""
+
+import time
+import queue
+import logging
+import smtplib
+import threading
+
+logger = logging.getLogger(__name__)
+
+# Pool limits — stays well under Gmail's concurrent login limit
+POOL_SIZE = 5
+MAX_MSGS_PER_CONN = 100  # recycle a connection after this many messages
+KEEPALIVE_INTERVAL = 60  # seconds between NOOPs on idle connections
+
+
+def _close_quietly(conn):
+    try:
+        conn.quit()
+    except Exception:
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+
+class SMTPPool:
+    """
+    Bounded, thread-safe pool of authenticated SMTP connections.
+
+    At most `size` connections exist at once (acquired or idle). Idle
+    connections are kept in a LIFO queue so the warmest one is reused first;
+    each is NOOP-checked on acquire and RSET on release. A connection is
+    retired after MAX_MSGS_PER_CONN messages (callers bump conn.msgs_sent).
+    """
+
+    def __init__(self, server: str, port: int, sender: str, password: str,
+                 size: int = POOL_SIZE):
+        self.server = server
+        self.port = port
+        self.sender = sender
+        self.password = password
+        self._idle = queue.LifoQueue(maxsize=size)
+        self._slots = threading.BoundedSemaphore(size)
+
+    def _open(self) -> smtplib.SMTP:
+        conn = smtplib.SMTP(self.server, self.port)
+        conn.ehlo()
+        conn.starttls()
+        conn.ehlo()
+        conn.login(self.sender, self.password)
+        conn.msgs_sent = 0
+        return conn
+
+    def acquire(self, timeout: float = None) -> smtplib.SMTP:
+        """Take a healthy connection from the pool, opening one if none are idle."""
+        if not self._slots.acquire(timeout=timeout):
+            raise TimeoutError("No SMTP connection available from pool")
+        try:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                return self._open()
+            try:
+                if conn.noop()[0] == 250:
+                    return conn
+            except Exception:
+                pass
+            _close_quietly(conn)
+            return self._open()
+        except Exception:
+            self._slots.release()
+            raise
+
+    def release(self, conn: smtplib.SMTP):
+        """Return a connection to the pool, or retire it if worn out or broken."""
+        try:
+            if conn.msgs_sent >= MAX_MSGS_PER_CONN:
+                _close_quietly(conn)
+                return
+            try:
+                conn.rset()
+            except Exception:
+                _close_quietly(conn)
+                return
+            try:
+                self._idle.put_nowait(conn)
+            except queue.Full:
+                _close_quietly(conn)
+        finally:
+            self._slots.release()
+
+    def replace(self, conn: smtplib.SMTP) -> smtplib.SMTP:
+        """Swap a dead or worn-out acquired connection for a fresh one."""
+        _close_quietly(conn)
+        try:
+            return self._open()
+        except Exception:
+            self._slots.release()
+            raise
+
+    def keepalive(self):
+        """NOOP every idle connection, dropping the ones that no longer answer."""
+        # Hold a slot per connection while it is out of the queue so the pool
+        # bound still holds if a sender acquires concurrently.
+        conns = []
+        while self._slots.acquire(blocking=False):
+            try:
+                conns.append(self._idle.get_nowait())
+            except queue.Empty:
+                self._slots.release()
+                break
+
+        # Put back oldest first so the warmest connection stays on top
+        for conn in reversed(conns):
+            try:
+                try:
+                    alive = conn.noop()[0] == 250
+                except Exception:
+                    alive = False
+                if alive:
+                    self._idle.put_nowait(conn)
+                else:
+                    _close_quietly(conn)
+            finally:
+                self._slots.release()
+
+    def close(self):
+        """Close all idle connections."""
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            _close_quietly(conn)
+
+
+_pools: dict[tuple, SMTPPool] = {}
+_pools_lock = threading.Lock()
+_keepalive_thread = None
+
+
+def _keepalive_loop():
+    while True:
+        time.sleep(KEEPALIVE_INTERVAL)
+        with _pools_lock:
+            pools = list(_pools.values())
+        for pool in pools:
+            try:
+                pool.keepalive()
+            except Exception as e:
+                logger.warning(f"SMTP keepalive failed: {e}")
+
+
+def get_pool(server: str, port: int, sender: str, password: str) -> SMTPPool:
+    """Return the shared pool for (server, port, sender), creating it on first use."""
+    global _keepalive_thread
+    key = (server, port, sender)
+    pool = _pools.get(key)
+    if pool is None:
+        with _pools_lock:
+            pool = _pools.get(key)
+            if pool is None:
+                pool = SMTPPool(server, port, sender, password)
+                _pools[key] = pool
+            if _keepalive_thread is None:
+                _keepalive_thread = threading.Thread(
+                    target=_keepalive_loop, name="smtp-keepalive", daemon=True
+                )
+                _keepalive_thread.start()
+    return pool
+
+
+def shutdown():
+    """Close every pooled SMTP connection (call on process exit)."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
@@ -0,0 +1,45 @@
+"""
+Tests for rss_feed's feedparser fallback.
+Run from the repository root: python -m unittest discover tests
+"""
+
+import unittest
+
+from requests.structures import CaseInsensitiveDict
+
+import rss_feed
+
+TITLE = "Doktora Sonrası Araştırmacı – Biyoenformatik (İstanbul, Ağustos)"
+
+# Not well-formed (bare "&"), so ElementTree rejects it and feedparser's loose parser takes over
+MALFORMED_RSS = f"""\
+<rss version="2.0"><channel><title>Jobs & more</title>
+<item><title>{TITLE}</title><link>https://example.org/1</link></item>
+</channel></rss>"""
+
+
+class FakeResponse:
+    """The parts of requests.Response that _parse_entries reads."""
+
+    def __init__(self, content: bytes, content_type: str):
+        self.content = content
+        # requests keeps the server's header casing
+        self.headers = CaseInsensitiveDict({"Content-Type": content_type})
+        self.url = "https://example.org/feed"
+
+
+class FeedparserFallbackTest(unittest.TestCase):
+    def test_utf8_titles_survive_the_fallback(self):
+        resp = FakeResponse(MALFORMED_RSS.encode("utf-8"), "application/rss+xml; charset=utf-8")
+        entries = rss_feed._parse_entries(resp.url, resp)
+        self.assertEqual([e.title for e in entries], [TITLE])
+
+    def test_charset_comes_from_the_content_type_header(self):
+        # Not valid UTF-8, so only the header's charset decodes it correctly
+        resp = FakeResponse(MALFORMED_RSS.encode("windows-1254"), "application/rss+xml; charset=windows-1254")
+        entries = rss_feed._parse_entries(resp.url, resp)
+        self.assertEqual([e.title for e in entries], [TITLE])
+
+
+if __name__ == "__main__":
+    unittest.main()